@@ -0,0 +1,136 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tempfile
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from src.game import Game
+from src.renderer import Renderer
+from src.simulation import Simulation
+from src.tile_chunks import TileChunks
+from src.image_manager import ImageManager
+from src.spatial_index import SpatialIndex
+from src.level_grid import LevelGrid
+from src.level_reader import load_level_from_csv
+from src.obstacle_store import ObstacleStore
+from src.level_generator import generate_level
+from src.constants import BACKGROUND_IMAGE_PATH, SCREEN_SIZE
+
+def load_obstacles(path: str, image_manager: ImageManager, obstacle_store: bool = False) -> list | ObstacleStore:
+    if obstacle_store: return ObstacleStore(LevelGrid.from_file(path), image_manager)
+    return load_level_from_csv(path, image_manager, pygame.sprite.Group(), SpatialIndex())
+
+def measure_load(path: str, image_manager: ImageManager, obstacle_store: bool = False) -> dict:
+    start = time.perf_counter()
+    obstacles = load_obstacles(path, image_manager, obstacle_store)
+    seconds = time.perf_counter() - start
+    del obstacles
+
+    tracemalloc.start()
+    obstacles = load_obstacles(path, image_manager, obstacle_store)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"obstacles": len(obstacles), "seconds": round(seconds, 4), "retained_bytes": current, "peak_bytes": peak}
+
+def measure_update(path: str, game: Game, ticks: int) -> dict:
+    game.restart(path)
+    count = 0
+    start = time.perf_counter()
+    while count < ticks and game.state == Game.State.PLAYING:
+        game.update()
+        count += 1
+    seconds = time.perf_counter() - start
+    return {"ticks": count, "ticks_per_second": round(count / seconds) if seconds else None}
+
+def measure_render(path: str, image_manager: ImageManager, renderer: Renderer, screen: pygame.Surface, frames: int, streaming: bool = False, obstacle_store: bool = False) -> dict:
+    simulation = Simulation(path, image_manager, streaming, obstacle_store=obstacle_store)
+    chunks = TileChunks(simulation.level, image_manager)
+    camera = simulation.camera
+    totals = {"background": 0, "tile_chunks": 0, "obstacles": 0, "group_draw": 0}
+
+    count = 0
+    while count < frames and simulation.step(False) == Simulation.Status.RUNNING:
+        count += 1
+        start = time.perf_counter_ns()
+        renderer.draw_background()
+        after_background = time.perf_counter_ns()
+        renderer.draw_tile_chunks(chunks.visible(camera.viewport), camera)
+        after_tiles = time.perf_counter_ns()
+        renderer.draw_obstacles(simulation.visible_obstacles(dynamic_only=True), camera)
+        after_obstacles = time.perf_counter_ns()
+        simulation.obstacles.draw(screen)
+        end = time.perf_counter_ns()
+
+        totals["background"] += after_background - start
+        totals["tile_chunks"] += after_tiles - after_background
+        totals["obstacles"] += after_obstacles - after_tiles
+        totals["group_draw"] += end - after_obstacles
+
+    return {"frames": count, **{f"{name}_ms": round(total / count / 1e6, 4) if count else None for name, total in totals.items()}}
+
+def regressions(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    previous = {run["columns"]: run for run in baseline.get("levels", [])}
+    found = []
+    for run in report["levels"]:
+        old = previous.get(run["columns"])
+        if not old: continue
+
+        checks = [("load.seconds", run["load"]["seconds"], old["load"]["seconds"], True), ("load.peak_bytes", run["load"]["peak_bytes"], old["load"]["peak_bytes"], True), ("update.ticks_per_second", run["update"]["ticks_per_second"], old["update"]["ticks_per_second"], False)]
+        checks += [(f"render.{key}", value, old["render"].get(key), True) for key, value in run["render"].items() if key.endswith("_ms")]
+        for name, new, before, lower_is_better in checks:
+            if not new or not before: continue
+            change = (new - before) / before if lower_is_better else (before - new) / before
+            if change > tolerance: found.append(f"{run['columns']} columns: {name} {before} -> {new}")
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark level loading, simulation and rendering on synthetic levels, headless")
+    parser.add_argument("--columns", type=int, nargs="+", default=[1000, 10000, 100000], help="lengths of the generated levels")
+    parser.add_argument("--density", type=float, default=0.2, help="fraction of cells above the player's lane that hold a tile")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the level generator")
+    parser.add_argument("--ticks", type=int, default=2000, help="maximum Game.update calls per level")
+    parser.add_argument("--frames", type=int, default=120, help="rendered frames per level")
+    parser.add_argument("--stream", action="store_true", help="load levels in streaming mode")
+    parser.add_argument("--obstacle-store", action="store_true", help="hold obstacles in the NumPy obstacle store instead of one sprite per tile")
+    parser.add_argument("--keep", default="", metavar="DIR", help="write the generated levels to DIR instead of a temporary directory")
+    parser.add_argument("--baseline", default="", metavar="PATH", help="compare against a previous JSON report and exit non-zero on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="relative slowdown allowed against the baseline")
+    parser.add_argument("-o", "--output", default="", metavar="PATH", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    game = Game(streaming=args.stream, frame_rate_limit=0, obstacle_store=args.obstacle_store)
+    screen = pygame.display.get_surface()
+    image_manager = ImageManager()
+    renderer = Renderer(screen, image_manager.get(BACKGROUND_IMAGE_PATH, SCREEN_SIZE))
+
+    report = {"python": platform.python_version(), "pygame": pygame.version.ver, "density": args.density, "seed": args.seed, "streaming": args.stream, "obstacle_store": args.obstacle_store, "levels": []}
+    with tempfile.TemporaryDirectory() as temporary:
+        directory = args.keep or temporary
+        os.makedirs(directory, exist_ok=True)
+        for columns in args.columns:
+            path = generate_level(os.path.join(directory, f"synthetic_{columns}.csv"), columns, args.density, args.seed)
+            report["levels"].append({"columns": columns, "load": measure_load(path, image_manager, args.obstacle_store), "update": measure_update(path, game, args.ticks), "render": measure_render(path, image_manager, renderer, screen, args.frames, args.stream, args.obstacle_store)})
+    pygame.quit()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file: file.write(output)
+    else: print(output)
+
+    if not args.baseline: return
+    with open(args.baseline) as file: baseline = json.load(file)
+    found = regressions(report, baseline, args.tolerance)
+    for line in found: print(line, file=sys.stderr)
+    sys.exit(1 if found else 0)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
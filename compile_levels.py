@@ -0,0 +1,21 @@
+import os
+import glob
+import argparse
+
+from src.level_compiler import compile_level
+from src.level_reader import compiled_level_path
+from src.constants import LEVELS_DIR
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile CSV levels into the binary .pydl format")
+    parser.add_argument("levels", nargs="*", help="CSV level files (default: levels/*.csv)")
+    parser.add_argument("-o", "--output-dir", default="", help="write compiled levels here instead of next to the CSV")
+    args = parser.parse_args()
+
+    for path in args.levels or sorted(glob.glob(os.path.join(LEVELS_DIR, "*.csv"))):
+        output = os.path.join(args.output_dir, os.path.basename(compiled_level_path(path))) if args.output_dir else ""
+        output = compile_level(path, output)
+        print(f"{path} -> {output} ({os.path.getsize(output)} bytes)")
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -1,7 +1,23 @@
+import argparse
+
 from src.game import Game
+from src.replay import InputRecording
+from src.constants import FRAME_RATE_LIMIT
 
 def main():
-    game = Game()
+    parser = argparse.ArgumentParser(description="Pydash: Geometry Dash in Python")
+    parser.add_argument("--stream", action="store_true", help="instantiate level tiles in chunks as they scroll into view")
+    parser.add_argument("--fps", type=int, default=FRAME_RATE_LIMIT, help="render frame rate cap, 0 for uncapped (simulation always runs at TICK_RATE)")
+    parser.add_argument("--record", default="", metavar="PATH", help="save the jump input of each run to PATH when it ends")
+    parser.add_argument("--replay", default="", metavar="PATH", help="play back a recorded run in the window")
+    parser.add_argument("--no-tile-chunks", action="store_true", help="draw static tiles as individual sprites instead of pre-baked chunks")
+    parser.add_argument("--dirty-rects", action="store_true", help="push only changed screen regions instead of flipping the whole display")
+    parser.add_argument("--obstacle-store", action="store_true", help="hold level obstacles in NumPy arrays and create sprites only for those near the player or on screen")
+    parser.add_argument("--trace", default="", metavar="PATH", help="write a Chrome trace (chrome://tracing, Perfetto) of every frame phase to PATH on exit")
+    args = parser.parse_args()
+
+    replay = InputRecording.load(args.replay) if args.replay else None
+    game = Game(streaming=args.stream, frame_rate_limit=args.fps, record_path=args.record, replay=replay, tile_chunks=not args.no_tile_chunks, dirty_rects=args.dirty_rects, trace_path=args.trace, obstacle_store=args.obstacle_store)
     game.run()
 
 if __name__ == '__main__':
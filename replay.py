@@ -0,0 +1,53 @@
+import os
+import sys
+import json
+import time
+import argparse
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+from src.image_manager import ImageManager
+from src.replay import InputRecording, play_back, REPLAY_HASH_INTERVAL
+
+def main():
+    parser = argparse.ArgumentParser(description="Play back recorded runs headless, as fast as possible, and print per-tick state hashes")
+    parser.add_argument("replays", nargs="+", help="replay files recorded with 'main.py --record'")
+    parser.add_argument("--hash-interval", type=int, default=REPLAY_HASH_INTERVAL, help="ticks between state hashes")
+    parser.add_argument("--stream", action="store_true", help="load levels in streaming mode")
+    parser.add_argument("--expect", default="", metavar="PATH", help="compare against a previous JSON report and exit non-zero on divergence")
+    parser.add_argument("-o", "--output", default="", metavar="PATH", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    image_manager = ImageManager()
+
+    report = {}
+    for path in args.replays:
+        start = time.perf_counter()
+        result = play_back(InputRecording.load(path), image_manager, args.hash_interval, args.stream)
+        elapsed = time.perf_counter() - start
+        report[path] = {"status": result.status.name, "ticks": result.ticks, "points": result.points, "ticks_per_second": round(result.ticks / elapsed) if elapsed else None, "hashes": result.hashes}
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file: file.write(output)
+    else: print(output)
+
+    if not args.expect: return
+    with open(args.expect) as file: expected = json.load(file)
+    diverged = False
+    for path, run in report.items():
+        previous = {tick: digest for tick, digest in expected.get(path, {}).get("hashes", [])}
+        mismatch = next((tick for tick, digest in run["hashes"] if tick in previous and previous[tick] != digest), None)
+        if mismatch is None and run["status"] == expected.get(path, {}).get("status"): continue
+        diverged = True
+        print(f"{path}: diverged at tick {mismatch}" if mismatch is not None else f"{path}: ended {run['status']}, expected {expected.get(path, {}).get('status')}", file=sys.stderr)
+    sys.exit(1 if diverged else 0)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
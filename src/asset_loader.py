@@ -0,0 +1,50 @@
+import os
+import threading
+import pygame
+
+from typing import Iterable
+
+from src.image_manager import ImageManager
+from src.font_manager import FontManager
+from src.level_reader import TILE_TYPES, tile_assets
+from src.constants import PROJECT_DIR
+
+class AssetLoader:
+    def __init__(self, image_manager: ImageManager, font_manager: FontManager) -> None:
+        self._image_manager = image_manager
+        self._font_manager = font_manager
+        self._music_path = ""
+        self._music_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def fonts(self) -> FontManager:
+        return self._font_manager
+
+    def preload(self, images: Iterable[tuple[str, tuple[int, int]]] = (), atlases: Iterable[tuple[str, tuple[int, int]]] = (), fonts: Iterable[tuple[str, int]] = (), music: str = "") -> None:
+        self._thread = threading.Thread(target=self._preload, args=(list(images), list(atlases), list(fonts), music), name="asset-preload", daemon=True)
+        self._thread.start()
+
+    def _preload(self, images: list[tuple[str, tuple[int, int]]], atlases: list[tuple[str, tuple[int, int]]], fonts: list[tuple[str, int]], music: str) -> None:
+        for value in TILE_TYPES:
+            tile_assets(value, self._image_manager)
+            tile_assets(-value, self._image_manager)
+        for path, size in images: self._image_manager.get(path, size)
+        for path, size in atlases: self._image_manager.get_rotation_atlas(path, size)
+        for path, size in fonts: self._font_manager.get(path, size)
+        if music:
+            try: self._load_music(music)
+            except pygame.error: pass
+
+    def wait(self) -> None:
+        if self._thread: self._thread.join()
+
+    def _load_music(self, relative_path: str) -> None:
+        with self._music_lock:
+            if self._music_path == relative_path: return
+            pygame.mixer_music.load(os.path.join(PROJECT_DIR, relative_path))
+            self._music_path = relative_path
+
+    def play_music(self, relative_path: str) -> None:
+        self._load_music(relative_path)
+        pygame.mixer_music.play()
\ No newline at end of file
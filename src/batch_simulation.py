@@ -0,0 +1,255 @@
+import numpy as np
+import pygame
+
+from typing import NamedTuple
+
+from src.camera import Camera
+from src.level_grid import LevelGrid
+from src.image_manager import ImageManager
+from src.level_reader import TILE_TYPES, tile_assets, resolve_level_path
+from src.simulation import Simulation
+from src.spatial_index import ALL_BEHAVIOURS
+from src.entities import Player, Obstacle
+from src.constants import GRAVITY, MAX_VELOCITY, ROTATION_ANGLE, JUMP_VELOCITY, JUMP_COOLDOWN_TICKS, PLAYER_IMAGE_PATH, SPRITE_SIZE
+
+# Observation columns returned by reset() and step()
+OBSERVATION_FIELDS = ("y", "velocity", "rotation", "on_ground", "points")
+
+def _mask_bounds(mask: pygame.Mask) -> pygame.Rect:
+    bounds = mask.get_bounding_rects()
+    return bounds[0].unionall(bounds[1:]) if bounds else pygame.Rect(0, 0, 0, 0)
+
+def _round(values: np.ndarray) -> np.ndarray:
+    # pygame rounds float rect coordinates half away from zero
+    return np.trunc(values + np.copysign(0.5, values)).astype(np.int64)
+
+class BatchState(NamedTuple):
+    tick: int
+    camera: tuple[float, float]
+    y: np.ndarray
+    velocity: np.ndarray
+    angle: np.ndarray
+    is_jumping: np.ndarray
+    is_on_ground: np.ndarray
+    last_jump_tick: np.ndarray
+    status: np.ndarray
+    points: np.ndarray
+    taken: np.ndarray
+
+    def select(self, agents) -> "BatchState":
+        return BatchState(self.tick, self.camera, *(field[agents] for field in self[2:]))
+
+class BatchSimulator:
+    def __init__(self, level_path: str, agents: int, image_manager: ImageManager) -> None:
+        self._agents = agents
+        grid = LevelGrid.from_file(resolve_level_path(level_path))
+        self._rows, self._columns = grid.height, grid.width
+
+        # Dense tile grid, plus a per-agent flag for every coin
+        self._tiles = np.zeros((self._rows, self._columns), np.int8)
+        self._coin_ids = np.full((self._rows, self._columns), -1, np.int32)
+        coins = 0
+        for col, row, value in grid:
+            if abs(value) not in TILE_TYPES: continue
+            self._tiles[row, col] = value
+            if TILE_TYPES[abs(value)][0].behaviour == Obstacle.Behaviour.COLLECTIBLE:
+                self._coin_ids[row, col] = coins
+                coins += 1
+        self._coin_count = coins
+
+        # Tile geometry and behaviour, indexed by tile value + offset (flipped tiles are negative)
+        self._tile_offset = max(TILE_TYPES)
+        span = 2 * self._tile_offset + 1
+        self._tile_size = np.zeros((span, 2), np.int64)
+        self._tile_hitbox = np.zeros((span, 4), np.int64)
+        self._tile_behaviour = np.full(span, -1, np.int8)
+        self._tile_full = np.zeros(span, bool)
+        self._tile_masks: list[pygame.Mask | None] = [None] * span
+        for value in range(-self._tile_offset, self._tile_offset + 1):
+            assets = tile_assets(value, image_manager) if value else None
+            if not assets: continue
+            obstacle_type, image, mask = assets
+            i = value + self._tile_offset
+            self._tile_size[i] = image.get_size()
+            self._tile_hitbox[i] = tuple(_mask_bounds(mask))
+            self._tile_behaviour[i] = obstacle_type.behaviour.value
+            self._tile_full[i] = mask.count() == image.get_width() * image.get_height()
+            self._tile_masks[i] = mask
+        self._tile_rows = int(self._tile_size[:, 1].max()) // SPRITE_SIZE[1]
+
+        # Player frame geometry for every rotation angle
+        atlas = image_manager.get_rotation_atlas(PLAYER_IMAGE_PATH, SPRITE_SIZE)
+        template = Player(atlas)
+        self._start = (template.position.x, template.position.y)
+        self._half_height = atlas.image.get_height() // 2
+        self._frame_left = np.zeros(360, np.int64)
+        self._frame_offset_y = np.zeros(360, np.float64)
+        self._frame_size = np.zeros((360, 2), np.int64)
+        self._frame_hitbox = np.zeros((360, 4), np.int64)
+        self._frame_full = np.zeros(360, bool)
+        self._frame_masks: list[pygame.Mask | None] = [None] * 360
+        for angle in range(0, 360, ROTATION_ANGLE):
+            frame = atlas.get(angle)
+            self._frame_left[angle] = frame.image.get_rect(topleft=(self._start[0] + frame.offset.x, 0)).left
+            self._frame_offset_y[angle] = frame.offset.y
+            self._frame_size[angle] = frame.image.get_size()
+            self._frame_hitbox[angle] = tuple(frame.bounds)
+            self._frame_full[angle] = frame.full
+            self._frame_masks[angle] = frame.mask
+        self._frame_columns = int(self._frame_size[:, 0].max()) // SPRITE_SIZE[0] + 2
+        self._frame_rows = int(self._frame_size[:, 1].max()) // SPRITE_SIZE[1] + 2
+
+        self._camera = Camera()
+        self.reset()
+
+    @property
+    def agents(self) -> int:
+        return self._agents
+
+    @property
+    def tick(self) -> int:
+        return self._tick
+
+    @property
+    def camera(self) -> Camera:
+        return self._camera
+
+    @property
+    def tiles(self) -> np.ndarray:
+        return self._tiles
+
+    @property
+    def status(self) -> np.ndarray:
+        return self._status
+
+    @property
+    def points(self) -> np.ndarray:
+        return self._points
+
+    def reset(self) -> np.ndarray:
+        self._tick = 0
+        self._camera.reset()
+        self._y = np.full(self._agents, self._start[1], np.float64)
+        self._velocity = np.zeros(self._agents, np.float64)
+        self._angle = np.zeros(self._agents, np.int64)
+        self._is_jumping = np.zeros(self._agents, bool)
+        self._is_on_ground = np.zeros(self._agents, bool)
+        self._last_jump_tick = np.full(self._agents, -JUMP_COOLDOWN_TICKS, np.int64)
+        self._status = np.full(self._agents, Simulation.Status.RUNNING.value, np.int8)
+        self._points = np.zeros(self._agents, np.int32)
+        self._taken = np.zeros((self._agents, self._coin_count), bool)
+        return self.observations()
+
+    def snapshot(self) -> BatchState:
+        return BatchState(self._tick, self._camera.snapshot(), self._y.copy(), self._velocity.copy(), self._angle.copy(), self._is_jumping.copy(), self._is_on_ground.copy(), self._last_jump_tick.copy(), self._status.copy(), self._points.copy(), self._taken.copy())
+
+    def restore(self, state: BatchState) -> None:
+        # The agent count follows the state, so a restore can also grow or shrink the batch
+        self._agents = len(state.y)
+        self._tick = state.tick
+        self._camera.restore(state.camera)
+        self._y, self._velocity, self._angle, self._is_jumping, self._is_on_ground, self._last_jump_tick, self._status, self._points, self._taken = (field.copy() for field in state[2:])
+
+    def observations(self) -> np.ndarray:
+        return np.column_stack((self._y, self._velocity, self._angle, self._is_on_ground, self._points)).astype(np.float32)
+
+    def done(self) -> np.ndarray:
+        return self._status != Simulation.Status.RUNNING.value
+
+    def _player_rects(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        left = self._frame_left[self._angle] + self._camera.x
+        top = _round(self._y + self._frame_offset_y[self._angle])
+        return left, top, self._frame_size[self._angle, 0], self._frame_size[self._angle, 1]
+
+    def _candidates(self, left: np.ndarray, top: np.ndarray, width: np.ndarray, height: np.ndarray, columns: int, rows: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # Every (agent, slot) pair whose tile rect overlaps the agent's rect, slots ordered by column then row
+        first_col = left // SPRITE_SIZE[0]
+        first_row = top // SPRITE_SIZE[1] - (self._tile_rows - 1)
+        col = first_col[:, None] + np.repeat(np.arange(columns), rows + self._tile_rows - 1)[None, :]
+        row = first_row[:, None] + np.tile(np.arange(rows + self._tile_rows - 1), columns)[None, :]
+
+        inside = (row >= 0) & (row < self._rows) & (col >= 0) & (col < self._columns)
+        values = np.where(inside, self._tiles[row.clip(0, self._rows - 1), col.clip(0, self._columns - 1)], 0)
+        size = self._tile_size[values + self._tile_offset]
+        tile_left, tile_top = col * SPRITE_SIZE[0], row * SPRITE_SIZE[1]
+        overlap = (values != 0) & (tile_left < (left + width)[:, None]) & (tile_left + size[..., 0] > left[:, None]) & (tile_top < (top + height)[:, None]) & (tile_top + size[..., 1] > top[:, None])
+        return overlap, values, col, row
+
+    def _touches_solid(self, left: np.ndarray, top: np.ndarray, width: np.ndarray, height: np.ndarray) -> np.ndarray:
+        overlap, values, _, _ = self._candidates(left, top, width, height, self._frame_columns, 2)
+        return (overlap & (self._tile_behaviour[values + self._tile_offset] == Obstacle.Behaviour.SOLID.value)).any(axis=1)
+
+    def step(self, actions) -> tuple[np.ndarray, np.ndarray]:
+        running = self._status == Simulation.Status.RUNNING.value
+        if not running.any(): return self.observations(), self.done()
+        self._tick += 1
+
+        left, top, width, height = self._player_rects()
+        jump = np.asarray(actions, bool) & running & self._is_on_ground & ~self._is_jumping & (self._tick - self._last_jump_tick >= JUMP_COOLDOWN_TICKS)
+        if jump.any(): jump &= ~self._touches_solid(left, top - 5, width, np.full(self._agents, 4))
+        self._velocity[jump] = JUMP_VELOCITY
+        self._is_jumping |= jump
+        self._is_on_ground &= ~jump
+        self._last_jump_tick[jump] = self._tick
+
+        self._is_on_ground &= ~(running & ~self._is_jumping & ~self._touches_solid(left, top + height + 1, width, np.full(self._agents, 4)))
+
+        airborne = running & ~self._is_on_ground
+        self._angle[airborne] = (self._angle[airborne] - ROTATION_ANGLE) % 360
+        self._velocity[airborne] = np.minimum(self._velocity[airborne] + GRAVITY, MAX_VELOCITY)
+        self._y[running] += self._velocity[running]
+
+        self._camera.advance()
+        self._collide(running)
+        return self.observations(), self.done()
+
+    def _collide(self, running: np.ndarray) -> None:
+        left, top, width, height = self._player_rects()
+        hitbox = self._frame_hitbox[self._angle]
+        hit_left, hit_top = left + hitbox[:, 0], top + hitbox[:, 1]
+        hit_right, hit_bottom = hit_left + hitbox[:, 2], hit_top + hitbox[:, 3]
+
+        overlap, values, col, row = self._candidates(left, top, width, height, self._frame_columns, self._frame_rows)
+        tile = values + self._tile_offset
+        tile_left, tile_top = col * SPRITE_SIZE[0], row * SPRITE_SIZE[1]
+        tile_hitbox = self._tile_hitbox[tile]
+        tile_hit_left, tile_hit_top = tile_left + tile_hitbox[..., 0], tile_top + tile_hitbox[..., 1]
+        coin = self._coin_ids[row.clip(0, self._rows - 1), col.clip(0, self._columns - 1)]
+        taken = np.take_along_axis(self._taken, coin.clip(0, None), axis=1) & (coin >= 0) if self._coin_count else np.zeros_like(overlap)
+
+        overlap &= running[:, None] & ~taken & (hitbox[:, None, 2] > 0) & (tile_hitbox[..., 2] > 0)
+        overlap &= (tile_hit_left < hit_right[:, None]) & (tile_hit_left + tile_hitbox[..., 2] > hit_left[:, None]) & (tile_hit_top < hit_bottom[:, None]) & (tile_hit_top + tile_hitbox[..., 3] > hit_top[:, None])
+        if not overlap.any(): return
+
+        behaviours = self._tile_behaviour[tile]
+        for behaviour in ALL_BEHAVIOURS:
+            for slot in np.flatnonzero((overlap & (behaviours == behaviour.value)).any(axis=0)):
+                agents = np.flatnonzero(overlap[:, slot] & (behaviours[:, slot] == behaviour.value))
+                agents = agents[[self._mask_overlap(agent, left[agent], top[agent], int(tile_left[agent, slot]), int(tile_top[agent, slot]), int(tile[agent, slot])) for agent in agents]]
+                if len(agents): self._handle(behaviour, agents, tile[agents, slot], tile_top[agents, slot], coin[agents, slot])
+
+    def _mask_overlap(self, agent: int, left: int, top: int, tile_left: int, tile_top: int, tile: int) -> bool:
+        angle = self._angle[agent]
+        if self._frame_full[angle] and self._tile_full[tile]: return True
+        return self._frame_masks[angle].overlap(self._tile_masks[tile], (tile_left - left, tile_top - top)) is not None
+
+    def _handle(self, behaviour: Obstacle.Behaviour, agents: np.ndarray, tile: np.ndarray, tile_top: np.ndarray, coin: np.ndarray) -> None:
+        if behaviour == Obstacle.Behaviour.SOLID:
+            _, top, _, height = self._player_rects()
+            center = top[agents] + height[agents] // 2
+            died = (tile_top <= center) | (center >= tile_top + self._tile_size[tile, 1])
+            self._status[agents[died]] = Simulation.Status.DIED.value
+
+            lands = ~died & (self._velocity[agents] > 0)
+            landing = agents[lands]
+            self._is_jumping[landing] = False
+            self._is_on_ground[landing] = True
+            self._angle[landing] = 0
+            self._y[landing] = tile_top[lands] - self._half_height
+            self._velocity[landing] = 0
+            self._last_jump_tick[landing] = self._tick
+        elif behaviour == Obstacle.Behaviour.LETHAL: self._status[agents] = Simulation.Status.DIED.value
+        elif behaviour == Obstacle.Behaviour.COLLECTIBLE:
+            self._taken[agents, coin] = True
+            self._points[agents] += 1
+        elif behaviour == Obstacle.Behaviour.GOAL: self._status[agents] = Simulation.Status.COMPLETED.value
\ No newline at end of file
@@ -0,0 +1,49 @@
+import pygame
+
+from src.constants import OBSTACLE_SPEED, SCREEN_SIZE
+
+class Camera:
+    def __init__(self, speed: float = -OBSTACLE_SPEED) -> None:
+        self._x = 0.0
+        self._previous_x = 0.0
+        self._speed = speed
+
+    @property
+    def x(self) -> int:
+        return int(self._x)
+
+    @property
+    def viewport(self) -> pygame.Rect:
+        left = int(min(self._previous_x, self._x))
+        return pygame.Rect(left, 0, SCREEN_SIZE[0] + self.x - left, SCREEN_SIZE[1])
+
+    @property
+    def speed(self) -> float:
+        return self._speed
+
+    @speed.setter
+    def speed(self, value: float) -> None:
+        self._speed = value
+
+    def advance(self) -> None:
+        self._previous_x = self._x
+        self._x += self._speed
+
+    def reset(self) -> None:
+        self._x = 0.0
+        self._previous_x = 0.0
+
+    def snapshot(self) -> tuple[float, float]:
+        return self._x, self._previous_x
+
+    def restore(self, state: tuple[float, float]) -> None:
+        self._x, self._previous_x = state
+
+    def offset(self, alpha: float = 1.0) -> int:
+        return int(self._previous_x + (self._x - self._previous_x) * alpha)
+
+    def to_screen(self, rect: pygame.Rect, alpha: float = 1.0) -> pygame.Rect:
+        return rect.move(-self.offset(alpha), 0)
+
+    def to_world(self, rect: pygame.Rect) -> pygame.Rect:
+        return rect.move(self.x, 0)
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+import math
 
 # Color definitions (RGBA)
 WHITE = (255, 255, 255)
@@ -9,14 +10,31 @@ GREEN = (0, 255, 0)
 PURPLE = (255, 0, 255)
 LIME = (0, 200, 0)
 DARK_YELLOW = (200, 200, 0)
+GOLD = (255, 215, 0)
+ORANGE = (255, 140, 0)
+CYAN = (0, 255, 255)
 
 BLUE_SEMI_TRANSPARENT = (0, 0, 255, 100)
 YELLOW_SEMI_TRANSPARENT = (255, 255, 0, 100)
+PROFILER_PANEL = (0, 0, 0, 160)
 
 # Screen and sprite dimensions
 SCREEN_SIZE = (800, 608)
 SPRITE_SIZE = (32, 32)
 
+# Rendered text surfaces kept by Renderer
+TEXT_CACHE_SIZE = 256
+
+# Debug overlay surfaces kept by Renderer, one per (mask, color)
+MASK_OVERLAY_CACHE_SIZE = 512
+
+# Particle pool
+PARTICLE_CAPACITY = 4096
+PARTICLE_MAX_SIZE = 8
+
+# Frames kept for the profiler's rolling percentiles
+PROFILER_WINDOW = 120
+
 # Physics constants
 GRAVITY = 0.86
 MAX_VELOCITY = 100
@@ -25,6 +43,16 @@ JUMP_VELOCITY = -10
 OBSTACLE_SPEED = -6
 JUMP_COOLDOWN_MS = 50
 
+# Simulation rate (cooldowns are counted in ticks)
+TICK_RATE = 60
+JUMP_COOLDOWN_TICKS = math.ceil(JUMP_COOLDOWN_MS * TICK_RATE / 1000)
+TICK_SECONDS = 1 / TICK_RATE
+MAX_FRAME_SECONDS = 0.25
+FRAME_RATE_LIMIT = 60
+
+# Level streaming (columns per chunk)
+STREAM_CHUNK_COLUMNS = 16
+
 # Path to the project directory
 PROJECT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '../')
 
@@ -33,4 +61,21 @@ PORTAL_IMAGE_PATH = os.path.join("resources/images", "portal.webp")
 PLAYER_IMAGE_PATH = os.path.join("resources/images", "avatar.png")
 BLOCK_IMAGE_PATH = os.path.join("resources/images", "block.png")
 SPIKE_IMAGE_PATH = os.path.join("resources/images", "spike.png")
-COIN_IMAGE_PATH = os.path.join("resources/images", "coin.png")
\ No newline at end of file
+COIN_IMAGE_PATH = os.path.join("resources/images", "coin.png")
+FONT_PATH = os.path.join("resources/fonts", "PUSAB_.ttf")
+MUSIC_PATH = os.path.join("resources/music", "bossfight-Vextron.mp3")
+
+# Pre-scaled images, keyed by source hash and size
+IMAGE_CACHE_DIR = os.path.join(PROJECT_DIR, ".cache/images")
+
+# Level catalogue: scanned directory, persisted index and menu layout
+LEVELS_DIR = os.path.normpath(os.path.join(PROJECT_DIR, "levels"))
+LEVEL_INDEX_PATH = os.path.join(PROJECT_DIR, ".cache/levels.json")
+THUMBNAIL_DIR = os.path.join(PROJECT_DIR, ".cache/thumbnails")
+THUMBNAIL_SIZE = (320, 96)
+THUMBNAIL_SCALE = 4
+MENU_VISIBLE_LEVELS = 5
+
+# Level verifier: columns per search segment and frontier states per worker task
+VERIFY_SEGMENT_COLUMNS = 16
+VERIFY_CHUNK_STATES = 8
\ No newline at end of file
@@ -3,5 +3,7 @@ import pygame
 from src.entities.obstacle import Obstacle
 
 class Coin(Obstacle):
-    def __init__(self, image: pygame.Surface, pos: pygame.math.Vector2, *groups) -> None:
-        super().__init__(image, pos, *groups)
\ No newline at end of file
+    behaviour = Obstacle.Behaviour.COLLECTIBLE
+
+    def __init__(self, image: pygame.Surface, pos: pygame.math.Vector2, *groups, mask: pygame.Mask | None = None) -> None:
+        super().__init__(image, pos, *groups, mask=mask)
\ No newline at end of file
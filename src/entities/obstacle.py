@@ -1,15 +1,30 @@
 import pygame
 
+from enum import Enum
+
 class Obstacle(pygame.sprite.Sprite):
-    def __init__(self, image: pygame.Surface, pos: pygame.math.Vector2, *groups) -> None:
+    class Behaviour(Enum):
+        SOLID = 0
+        LETHAL = 1
+        COLLECTIBLE = 2
+        GOAL = 3
+
+    behaviour = Behaviour.SOLID
+    is_static = False
+
+    def __init__(self, image: pygame.Surface, pos: pygame.math.Vector2, *groups, mask: pygame.Mask | None = None) -> None:
         super().__init__(*groups)
         self._image = image
         self._rect = self._image.get_rect(topleft=pos)
-        self._mask = pygame.mask.from_surface(self._image)
+        self._mask = mask if mask is not None else pygame.mask.from_surface(self._image)
+        self._hitbox: pygame.Rect | None = None
+        self._has_full_mask: bool | None = None
+        self._is_active = True
 
     def move(self, direction: pygame.math.Vector2) -> None:
         self._rect.x += int(direction.x)
         self._rect.y += int(direction.y)
+        self._hitbox = None
 
     @property
     def image(self) -> pygame.Surface:
@@ -21,4 +36,24 @@ class Obstacle(pygame.sprite.Sprite):
 
     @property
     def mask(self) -> pygame.mask.Mask:
-        return self._mask
\ No newline at end of file
+        return self._mask
+
+    @property
+    def hitbox(self) -> pygame.Rect:
+        if self._hitbox is None:
+            bounds = self._mask.get_bounding_rects()
+            self._hitbox = bounds[0].unionall(bounds[1:]).move(self._rect.topleft) if bounds else pygame.Rect(self._rect.topleft, (0, 0))
+        return self._hitbox
+
+    @property
+    def has_full_mask(self) -> bool:
+        if self._has_full_mask is None: self._has_full_mask = self._mask.count() == self._rect.width * self._rect.height
+        return self._has_full_mask
+
+    @property
+    def is_active(self) -> bool:
+        return self._is_active
+
+    @is_active.setter
+    def is_active(self, value: bool) -> None:
+        self._is_active = value
\ No newline at end of file
@@ -3,5 +3,7 @@ import pygame
 from src.entities.obstacle import Obstacle
 
 class Portal(Obstacle):
-    def __init__(self, image: pygame.Surface, position: pygame.math.Vector2, *groups) -> None:
-        super().__init__(image, position, *groups)
\ No newline at end of file
+    behaviour = Obstacle.Behaviour.GOAL
+
+    def __init__(self, image: pygame.Surface, position: pygame.math.Vector2, *groups, mask: pygame.Mask | None = None) -> None:
+        super().__init__(image, position, *groups, mask=mask)
\ No newline at end of file
@@ -3,5 +3,8 @@ import pygame
 from src.entities.obstacle import Obstacle
 
 class Spike(Obstacle):
-    def __init__(self, image: pygame.Surface, pos: pygame.math.Vector2, *groups) -> None:
-        super().__init__(image, pos, *groups)
\ No newline at end of file
+    behaviour = Obstacle.Behaviour.LETHAL
+    is_static = True
+
+    def __init__(self, image: pygame.Surface, pos: pygame.math.Vector2, *groups, mask: pygame.Mask | None = None) -> None:
+        super().__init__(image, pos, *groups, mask=mask)
\ No newline at end of file
@@ -0,0 +1,29 @@
+import io
+import os
+import threading
+import pygame
+
+from src.constants import PROJECT_DIR
+
+class FontManager:
+    def __init__(self) -> None:
+        self._data: dict[str, bytes] = {}
+        self._fonts: dict[tuple[str | None, int], pygame.font.Font] = {}
+        self._lock = threading.Lock()
+
+    def _read(self, relative_path: str) -> bytes:
+        if relative_path in self._data: return self._data[relative_path]
+        with open(os.path.join(PROJECT_DIR, relative_path), "rb") as file: data = self._data[relative_path] = file.read()
+        return data
+
+    def get(self, relative_path: str | None, size: int) -> pygame.font.Font:
+        cache_key = (relative_path, size)
+        if cache_key in self._fonts: return self._fonts[cache_key]
+
+        with self._lock:
+            if cache_key in self._fonts: return self._fonts[cache_key]
+
+            font = pygame.font.Font(io.BytesIO(self._read(relative_path)) if relative_path else None, size)
+
+            self._fonts[cache_key] = font
+            return font
\ No newline at end of file
@@ -1,14 +1,21 @@
-import pygame
 import os
+import pygame
 
 from enum import Enum
 
 from src.renderer import Renderer
 from src.input_handler import InputHandler
 from src.image_manager import ImageManager
-from src.level_reader import load_level_from_csv
-from src.entities import Player, Spike, Block, Coin, Portal, Obstacle
-from src.constants import SCREEN_SIZE, BLACK, OBSTACLE_SPEED, PLAYER_IMAGE_PATH, BACKGROUND_IMAGE_PATH, SPRITE_SIZE
+from src.font_manager import FontManager
+from src.asset_loader import AssetLoader
+from src.simulation import Simulation, SimulationSnapshot
+from src.level_catalogue import LevelCatalogue
+from src.tile_chunks import TileChunks
+from src.particles import ParticleSystem
+from src.profiler import Profiler
+from src.replay import InputRecording
+from src.entities import Player
+from src.constants import SCREEN_SIZE, BLACK, WHITE, GOLD, PLAYER_IMAGE_PATH, BACKGROUND_IMAGE_PATH, MUSIC_PATH, SPRITE_SIZE, TICK_SECONDS, MAX_FRAME_SECONDS, FRAME_RATE_LIMIT, LEVELS_DIR
 
 class Game:
     class State(Enum):
@@ -16,28 +23,46 @@ class Game:
         PLAYING = 1
         GAME_OVER = 2
 
-    def __init__(self) -> None:
+    def __init__(self, streaming: bool = False, frame_rate_limit: int = FRAME_RATE_LIMIT, record_path: str = "", replay: InputRecording | None = None, tile_chunks: bool = True, dirty_rects: bool = False, trace_path: str = "", obstacle_store: bool = False) -> None:
         pygame.init()
 
         self._screen = pygame.display.set_mode(SCREEN_SIZE)
         self._image_manager = ImageManager()
+        self._assets = AssetLoader(self._image_manager, FontManager())
 
         pygame.display.set_caption('Pydash: Geometry Dash in Python')
         pygame.display.set_icon(self._image_manager.get(PLAYER_IMAGE_PATH, SPRITE_SIZE))
 
         self._input_handler = InputHandler(self)
-        self._renderer = Renderer(self._screen)
+        self._renderer = Renderer(self._screen, self._image_manager.get(BACKGROUND_IMAGE_PATH, SCREEN_SIZE), dirty_rects, self._assets.fonts)
 
         self._clock = pygame.time.Clock()
-        self._obstacles_group = pygame.sprite.Group()
+        self._profiler = Profiler(trace_path=trace_path)
+        self._frame_rate_limit = frame_rate_limit
+        self._accumulator = 0.0
+        self._simulation: Simulation | None = None
+        self._level_snapshot: SimulationSnapshot | None = None
+        self._streaming = streaming
+        self._obstacle_store = obstacle_store
+        self._use_tile_chunks = tile_chunks
+        self._tile_chunks: TileChunks | None = None
+        self._particles = ParticleSystem()
+        self._record_path = record_path
+        self._recording = InputRecording("")
+        self._replay = replay
         self._running = True
         self._debug_view = False
+        self._show_query_region = False
+        self._show_candidates = False
 
         self._state = Game.State.LEVEL_SELECT
-        self._available_levels = ["levels/level1.csv", "levels/testing.csv"]
+        self._catalogue = LevelCatalogue()
+        self._catalogue.refresh()
         self._selected_level = 0
         self._level_complete = False
         self._current_level_path = ""
+        self._assets.preload(atlases=[(PLAYER_IMAGE_PATH, SPRITE_SIZE)], music=MUSIC_PATH)
+        if replay: self.restart(replay.level_path)
 
     @property
     def state(self) -> State:
@@ -49,7 +74,7 @@ class Game:
 
     @property
     def available_levels(self) -> list[str]:
-        return self._available_levels
+        return self._catalogue.paths
 
     @property
     def selected_level(self) -> int:
@@ -61,7 +86,15 @@ class Game:
 
     @property
     def player(self) -> Player:
-        return self._player
+        return self._simulation.player
+
+    @property
+    def points(self) -> int:
+        return self._simulation.points if self._simulation else 0
+
+    @property
+    def recording(self) -> InputRecording:
+        return self._recording
 
     @property
     def debug_view(self) -> bool:
@@ -71,6 +104,22 @@ class Game:
     def debug_view(self, value: bool) -> None:
         self._debug_view = value
 
+    @property
+    def show_query_region(self) -> bool:
+        return self._show_query_region
+
+    @show_query_region.setter
+    def show_query_region(self, value: bool) -> None:
+        self._show_query_region = value
+
+    @property
+    def show_candidates(self) -> bool:
+        return self._show_candidates
+
+    @show_candidates.setter
+    def show_candidates(self, value: bool) -> None:
+        self._show_candidates = value
+
     @property
     def current_level_path(self) -> str:
         return self._current_level_path
@@ -88,91 +137,85 @@ class Game:
         self._level_complete = False
 
         self._debug_view = False
-        self._points = 0
-
-        self._player_sprite = pygame.sprite.Group()
-        self._player = Player(self._image_manager.get(PLAYER_IMAGE_PATH, SPRITE_SIZE), self._player_sprite)
 
-        self._obstacles_group.empty()
-        level_to_load = level_path or "levels/level1.csv"
+        level_to_load = level_path or os.path.join(LEVELS_DIR, "level1.csv")
         self._current_level_path = level_to_load
-        self._obstacles = load_level_from_csv(level_to_load, self._image_manager, self._obstacles_group)
-        self._portal_obstacle = next((o for o in self._obstacles if isinstance(o, Portal)), None)
-        if self._portal_obstacle: self._initial_portal_distance = abs(self._portal_obstacle.rect.left - self._player.rect.left)
-
-        pygame.mixer_music.load(os.path.join("resources/music", "bossfight-Vextron.mp3"))
-        pygame.mixer_music.play()
-
-    def collision_checks(self, obstacle: Obstacle):
-        def complete_level(has_completed: bool):
-            self._player.died()
-            pygame.mixer_music.stop()
-            self._state = Game.State.GAME_OVER
-            self._level_complete = has_completed
-        if isinstance(obstacle, Spike): complete_level(False)
-        elif isinstance(obstacle, Block):
-            if obstacle.rect.top <= self._player.rect.center[1] or self._player.rect.center[1] >= obstacle.rect.bottom:  complete_level(False)
-            elif self._player.velocity > 0: self._player.land(obstacle.rect.top)
-        elif isinstance(obstacle, Coin):
-            self._obstacles_group.remove(obstacle)
-            self._obstacles.remove(obstacle)
-            self._points += 1
-        elif isinstance(obstacle, Portal): complete_level(True)
-
-    def has_block_above(self) -> bool:
-        head_rect = self._player.rect.copy()
-        head_rect.height = 4
-        head_rect.top = self._player.rect.top - head_rect.height - 1
-        return any(isinstance(obstacle, Block) and obstacle.rect.colliderect(head_rect) for obstacle in self._obstacles)
-
-    def has_block_below(self) -> bool:
-        head_rect = self._player.rect.copy()
-        head_rect.height = 4
-        head_rect.bottom = self._player.rect.bottom + head_rect.height + 1
-        return any(isinstance(obstacle, Block) and obstacle.rect.colliderect(head_rect) for obstacle in self._obstacles)
-
-    def update(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_SPACE] and not self.has_block_above(): self._player.jump()
-
-        if not self._player.is_jumping and not self.has_block_below(): self._player.is_on_ground = False
-
-        self.contact_point = None
-        if not self._player.is_on_ground: self._player.rotate()
-
-        self._player.update()
-
-        for obstacle in self._obstacles:
-            obstacle.move(pygame.math.Vector2(OBSTACLE_SPEED, 0))
-            offset = (obstacle.rect.left - self._player.rect.left, obstacle.rect.top - self._player.rect.top)
-            overlap = self._player.mask.overlap(obstacle.mask, offset)
-            if overlap: self.contact_point = (overlap[0] + self._player.rect.left, overlap[1] + self._player.rect.top)
-            if pygame.sprite.collide_mask(self._player, obstacle):
-                self.collision_checks(obstacle)
+        if self._simulation and self._simulation.level_path == level_to_load: self._simulation.restore(self._level_snapshot)
+        else:
+            self._simulation = Simulation(level_to_load, self._image_manager, self._streaming, self._profiler, self._obstacle_store)
+            self._level_snapshot = self._simulation.snapshot()
+            self._tile_chunks = TileChunks(self._simulation.level, self._image_manager) if self._use_tile_chunks else None
+        self._recording = InputRecording(level_to_load)
+        self._particles.clear()
+        self._accumulator = 0.0
+
+        self._assets.play_music(MUSIC_PATH)
+
+    def update(self) -> None:
+        jump = self._replay[self._simulation.tick] if self._replay else pygame.key.get_pressed()[pygame.K_SPACE]
+        self._recording.record(jump)
+        status = self._simulation.step(jump)
+
+        with self._profiler.section("update.particles"):
+            player = self._simulation.player
+            if status == Simulation.Status.RUNNING: self._particles.emit_trail((player.rect.left - 6, player.rect.bottom - 6), WHITE)
+            for coin in self._simulation.collected: self._particles.burst(self._simulation.camera.to_screen(coin.rect).center, 24, GOLD)
+            self._particles.update()
+        if status == Simulation.Status.RUNNING: return
+
+        pygame.mixer_music.stop()
+        if self._record_path: self._recording.save(self._record_path)
+        self._state = Game.State.GAME_OVER
+        self._level_complete = status == Simulation.Status.COMPLETED
+
+    def _draw_level_select_menu(self) -> None:
+        levels = self._catalogue.entries
+        thumbnail = self._catalogue.thumbnail(levels[self._selected_level]) if levels else None
+        self._renderer.draw_level_select_menu(levels, self._selected_level, thumbnail)
 
     def run(self):
+        profile = self._profiler.section
+        frame_seconds = 0.0
         while self._running:
-            self._input_handler.handle_events()
-            self._screen.blit(self._image_manager.get(BACKGROUND_IMAGE_PATH, SCREEN_SIZE), (0, 0))
+            with profile("events"): self._input_handler.handle_events()
+            if self._state == Game.State.PLAYING and not self._simulation and not self.available_levels: self._state = Game.State.LEVEL_SELECT
 
             if self._state == Game.State.PLAYING:
-                if not getattr(self, "player", None): self.restart(self._available_levels[self._selected_level])
-                if not self._player.is_dead: self.update()
-
-                self._renderer.draw_text(f"Points: {getattr(self, 'points', 0)}", self._renderer._small_font, BLACK, 120, 50)
-                if self._portal_obstacle and not self._player.is_dead: self._renderer.draw_progress_bar(current_distance=abs(self._portal_obstacle.rect.left - self._player.rect.left), initial_portal_distance=self._initial_portal_distance)
+                with profile("render.background"): self._renderer.draw_background()
+                if not self._simulation: self.restart(self.available_levels[self._selected_level])
+                simulation = self._simulation
+                player = simulation.player
+
+                self._accumulator += frame_seconds
+                with profile("update"):
+                    while self._accumulator >= TICK_SECONDS and self._state == Game.State.PLAYING:
+                        self.update()
+                        self._accumulator -= TICK_SECONDS
+                alpha = self._accumulator / TICK_SECONDS if self._state == Game.State.PLAYING else 1.0
+
+                with profile("render.hud"):
+                    self._renderer.draw_text(f"Points: {self.points}", self._renderer._small_font, BLACK, 120, 50)
+                    if simulation.has_portal and not player.is_dead: self._renderer.draw_progress_bar(current_distance=simulation.portal_distance(), initial_portal_distance=simulation.initial_portal_distance)
 
                 if self._debug_view:
-                    self._renderer.draw_bounding_boxes(self._player, self._obstacles, self.contact_point)
+                    with profile("render.debug"): self._renderer.draw_bounding_boxes(player, simulation.visible_obstacles(), simulation.camera, simulation.contact_point, simulation.query_rects if self._show_query_region else None, simulation.candidates if self._show_candidates else None)
+                    self._renderer.draw_profiler_overlay(self._profiler)
                 else:
-                    if not self._player.is_dead: self._player.draw_particle_trail(self._screen)
-                    self._player.display(self._screen)
-                    self._obstacles_group.draw(self._screen)
-
-            elif self._state == Game.State.LEVEL_SELECT: self._renderer.draw_level_select_menu(self._available_levels, self._selected_level)
-            elif self._state == Game.State.GAME_OVER: self._renderer.draw_game_over_menu(self._level_complete, self._input_handler.game_over_selection.value, self._points)
-
-            pygame.display.flip()
-            self._clock.tick(60)
-
+                    with profile("render.particles"): self._renderer.mark_dirty(self._particles.draw(self._screen))
+                    with profile("render.player"): self._renderer.mark_dirty(player.display(self._screen, alpha))
+                    with profile("render.tiles"):
+                        if self._tile_chunks: self._renderer.draw_tile_chunks(self._tile_chunks.visible(simulation.camera.viewport), simulation.camera, alpha)
+                    with profile("render.obstacles"): self._renderer.draw_obstacles(simulation.visible_obstacles(dynamic_only=self._tile_chunks is not None), simulation.camera, alpha)
+
+            elif self._state == Game.State.LEVEL_SELECT:
+                with profile("render.menu"): self._draw_level_select_menu()
+            elif self._state == Game.State.GAME_OVER:
+                with profile("render.menu"): self._renderer.draw_game_over_menu(self._level_complete, self._input_handler.game_over_selection.value, self.points)
+
+            with profile("present"): self._renderer.present()
+            self._profiler.end_frame()
+            frame_seconds = min(self._clock.tick(self._frame_rate_limit) / 1000, MAX_FRAME_SECONDS)
+
+        self._profiler.save_trace()
+        self._assets.wait()
         pygame.quit()
\ No newline at end of file
@@ -1,28 +1,100 @@
 import os
+import hashlib
+import threading
 import pygame
 
 from typing import Tuple
-from src.constants import PROJECT_DIR
+from src.constants import PROJECT_DIR, IMAGE_CACHE_DIR
+from src.rotation_atlas import RotationAtlas
 
 class ImageManager:
-    def __init__(self) -> None:
+    def __init__(self, cache_dir: str = IMAGE_CACHE_DIR) -> None:
         self._originals: dict[str, pygame.Surface] = {}
-        self._cache: dict[tuple[str, Tuple[int, int]], pygame.Surface] = {}
+        self._cache: dict[tuple[str, Tuple[int, int], int], pygame.Surface] = {}
+        self._masks: dict[tuple[str, Tuple[int, int], int], pygame.Mask] = {}
+        self._atlases: dict[tuple[str, Tuple[int, int]], RotationAtlas] = {}
+        self._digests: dict[str, str] = {}
+        self._cache_dir = cache_dir
+        self._lock = threading.RLock()
 
     def _load_original(self, relative_path: str) -> pygame.Surface:
         if relative_path in self._originals: return self._originals[relative_path]
         full = os.path.join(PROJECT_DIR, relative_path)
         surf = pygame.image.load(full)
-        surf = surf.convert_alpha() if surf.get_alpha() else surf.convert()
+        if pygame.display.get_surface(): surf = surf.convert_alpha() if surf.get_alpha() else surf.convert()
         self._originals[relative_path] = surf
         return surf
 
-    def get(self, relative_path: str, size: Tuple[int, int]) -> pygame.Surface:
-        cache_key = (relative_path, size)
+    def _cache_path(self, relative_path: str, size: Tuple[int, int], mode: str) -> str:
+        digest = self._digests.get(relative_path)
+        if digest is None:
+            with open(os.path.join(PROJECT_DIR, relative_path), "rb") as file: digest = self._digests[relative_path] = hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+        return os.path.join(self._cache_dir, f"{digest}-{size[0]}x{size[1]}.{mode.lower()}")
+
+    def _load_cached(self, relative_path: str, size: Tuple[int, int]) -> pygame.Surface | None:
+        for mode in ("RGBA", "RGB"):
+            try:
+                with open(self._cache_path(relative_path, size, mode), "rb") as file: data = file.read()
+            except OSError: continue
+            if len(data) != size[0] * size[1] * len(mode): continue
+
+            surface = pygame.image.frombytes(data, size, mode)
+            if pygame.display.get_surface(): surface = surface.convert_alpha() if mode == "RGBA" else surface.convert()
+            return surface
+        return None
+
+    def _store_cached(self, relative_path: str, size: Tuple[int, int], surface: pygame.Surface) -> None:
+        mode = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+        path = self._cache_path(relative_path, size, mode)
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            temporary = f"{path}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as file: file.write(pygame.image.tobytes(surface, mode))
+            os.replace(temporary, path)
+        except OSError: pass
+
+    def _scale(self, relative_path: str, size: Tuple[int, int]) -> pygame.Surface:
+        surface = self._load_cached(relative_path, size) if self._cache_dir else None
+        if surface: return surface
+
+        surface = pygame.transform.smoothscale(self._load_original(relative_path), size)
+        if self._cache_dir: self._store_cached(relative_path, size, surface)
+        return surface
+
+    def get(self, relative_path: str, size: Tuple[int, int], rotation: int = 0) -> pygame.Surface:
+        cache_key = (relative_path, size, rotation % 360)
         if cache_key in self._cache: return self._cache[cache_key]
 
-        surface = self._load_original(relative_path)
-        surface = pygame.transform.smoothscale(surface, size)
+        with self._lock:
+            if cache_key in self._cache: return self._cache[cache_key]
+
+            if cache_key[2]: surface = pygame.transform.rotate(self.get(relative_path, size), cache_key[2])
+            else: surface = self._scale(relative_path, size)
+
+            self._cache[cache_key] = surface
+            return surface
+
+    def get_mask(self, relative_path: str, size: Tuple[int, int], rotation: int = 0) -> pygame.Mask:
+        cache_key = (relative_path, size, rotation % 360)
+        if cache_key in self._masks: return self._masks[cache_key]
+
+        with self._lock:
+            if cache_key in self._masks: return self._masks[cache_key]
+
+            mask = pygame.mask.from_surface(self.get(relative_path, size, rotation))
+
+            self._masks[cache_key] = mask
+            return mask
+
+    def get_rotation_atlas(self, relative_path: str, size: Tuple[int, int]) -> RotationAtlas:
+        cache_key = (relative_path, size)
+        if cache_key in self._atlases: return self._atlases[cache_key]
+
+        with self._lock:
+            if cache_key in self._atlases: return self._atlases[cache_key]
+
+            atlas = RotationAtlas(self.get(relative_path, size))
+            atlas.bake()
 
-        self._cache[cache_key] = surface
-        return surface
\ No newline at end of file
+            self._atlases[cache_key] = atlas
+            return atlas
\ No newline at end of file
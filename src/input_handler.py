@@ -60,6 +60,7 @@ class InputHandler:
         elif self._game.state == self._game.State.PLAYING: self.handle_playing(event)
 
     def handle_level_select(self, event: pygame.event.Event) -> None:
+        if not self._game.available_levels: return
         if event.key == pygame.K_UP: self._game.selected_level = (self._game.selected_level - 1) % len(self._game.available_levels)
         elif event.key == pygame.K_DOWN: self._game.selected_level = (self._game.selected_level + 1) % len(self._game.available_levels)
         elif event.key == pygame.K_RETURN: self._game.restart(self._game.available_levels[self._game.selected_level])
@@ -74,4 +75,6 @@ class InputHandler:
 
     def handle_playing(self, event: pygame.event.Event) -> None:
         if event.key == pygame.K_TAB: self._game.debug_view = not self._game.debug_view
+        elif event.key == pygame.K_q: self._game.show_query_region = not self._game.show_query_region
+        elif event.key == pygame.K_c: self._game.show_candidates = not self._game.show_candidates
         elif self._game.player.is_dead: self._game.state = self._game.State.GAME_OVER
\ No newline at end of file
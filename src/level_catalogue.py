@@ -0,0 +1,122 @@
+import os
+import json
+import hashlib
+import pygame
+
+from typing import NamedTuple
+
+from src.level_grid import LevelGrid
+from src.level_reader import LEVEL_EXTENSION
+from src.constants import LEVELS_DIR, LEVEL_INDEX_PATH, THUMBNAIL_DIR, THUMBNAIL_SIZE, THUMBNAIL_SCALE, PURPLE, GOLD, RED
+
+LEVEL_INDEX_VERSION = 1
+
+# Tile value -> thumbnail pixel colour
+THUMBNAIL_COLORS = {1: (40, 40, 40), 2: RED, 3: GOLD, 4: PURPLE}
+
+class LevelEntry(NamedTuple):
+    path: str
+    name: str
+    mtime: float
+    size: int
+    digest: str
+    columns: int
+    rows: int
+    coins: int
+    portal_column: int | None
+
+class LevelCatalogue:
+    def __init__(self, directory: str = LEVELS_DIR, index_path: str = LEVEL_INDEX_PATH, thumbnail_dir: str = THUMBNAIL_DIR) -> None:
+        self._directory = directory
+        self._index_path = index_path
+        self._thumbnail_dir = thumbnail_dir
+        self._entries: list[LevelEntry] = []
+        self._thumbnails: dict[str, pygame.Surface | None] = {}
+
+    @property
+    def entries(self) -> list[LevelEntry]:
+        return self._entries
+
+    @property
+    def paths(self) -> list[str]:
+        return [entry.path for entry in self._entries]
+
+    def _scan(self) -> list[str]:
+        try: names = sorted(os.listdir(self._directory))
+        except FileNotFoundError: return []
+        stems = {os.path.splitext(name)[0] for name in names if name.endswith(".csv")}
+        return [os.path.join(self._directory, name) for name in names if name.endswith(".csv") or (name.endswith(LEVEL_EXTENSION) and os.path.splitext(name)[0] not in stems)]
+
+    def _load_index(self) -> dict[str, LevelEntry]:
+        try:
+            with open(self._index_path) as file: index = json.load(file)
+        except (OSError, ValueError): return {}
+        if index.get("version") != LEVEL_INDEX_VERSION: return {}
+        return {path: LevelEntry(*fields) for path, fields in index.get("levels", {}).items()}
+
+    def _save_index(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self._index_path), exist_ok=True)
+            with open(self._index_path, "w") as file: json.dump({"version": LEVEL_INDEX_VERSION, "levels": {entry.path: list(entry) for entry in self._entries}}, file)
+        except OSError: pass
+
+    def _thumbnail_path(self, entry: LevelEntry) -> str:
+        return os.path.join(self._thumbnail_dir, f"{entry.digest}.png")
+
+    def _build_entry(self, path: str, stat: os.stat_result, digest: str) -> LevelEntry:
+        grid = LevelGrid.from_file(path)
+        cells = list(grid)
+        portal = grid.find(4)
+        entry = LevelEntry(path, os.path.splitext(os.path.basename(path))[0], stat.st_mtime, stat.st_size, digest, grid.width, grid.height, sum(1 for _, _, value in cells if value == 3), portal[0] if portal else None)
+
+        if entry.columns and entry.rows:
+            surface = pygame.Surface((entry.columns, entry.rows), pygame.SRCALPHA)
+            with pygame.PixelArray(surface) as pixels:
+                for col, row, value in cells:
+                    color = THUMBNAIL_COLORS.get(abs(value))
+                    if color: pixels[col, row] = surface.map_rgb(color)
+
+            size = (min(entry.columns * THUMBNAIL_SCALE, THUMBNAIL_SIZE[0]), min(entry.rows * THUMBNAIL_SCALE, THUMBNAIL_SIZE[1]))
+            surface = pygame.transform.scale(surface, size) if size[0] >= entry.columns else pygame.transform.smoothscale(surface, size)
+            try:
+                os.makedirs(self._thumbnail_dir, exist_ok=True)
+                pygame.image.save(surface, self._thumbnail_path(entry))
+            except (OSError, pygame.error): pass
+        return entry
+
+    def refresh(self) -> int:
+        index = self._load_index()
+        entries: list[LevelEntry] = []
+        rebuilt = 0
+        for path in self._scan():
+            # An unreadable or malformed level is left out rather than keeping every other level from loading
+            try:
+                stat = os.stat(path)
+                entry = index.get(path)
+                if entry and entry.mtime == stat.st_mtime and entry.size == stat.st_size and os.path.exists(self._thumbnail_path(entry)):
+                    entries.append(entry)
+                    continue
+
+                with open(path, "rb") as file: digest = hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+                if entry and entry.digest == digest and os.path.exists(self._thumbnail_path(entry)): entry = entry._replace(mtime=stat.st_mtime, size=stat.st_size)
+                else:
+                    entry = self._build_entry(path, stat, digest)
+                    rebuilt += 1
+            except (OSError, ValueError, OverflowError): continue
+            entries.append(entry)
+
+        changed = entries != list(index.values())
+        self._entries = entries
+        if changed: self._save_index()
+        return rebuilt
+
+    def thumbnail(self, entry: LevelEntry) -> pygame.Surface | None:
+        if entry.digest in self._thumbnails: return self._thumbnails[entry.digest]
+
+        try:
+            surface = pygame.image.load(self._thumbnail_path(entry))
+            if pygame.display.get_surface(): surface = surface.convert_alpha()
+        except (OSError, pygame.error): surface = None
+
+        self._thumbnails[entry.digest] = surface
+        return surface
\ No newline at end of file
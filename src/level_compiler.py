@@ -0,0 +1,15 @@
+from src.level_reader import iter_csv_cells, compiled_level_path, LEVEL_MAGIC, LEVEL_VERSION, LEVEL_HEADER, LEVEL_RECORD, FLAG_ROTATED
+
+def compile_level(csv_path: str, output_path: str = "") -> str:
+    cells = sorted(iter_csv_cells(csv_path))
+    width = max((col for col, _, _ in cells), default=-1) + 1
+    height = max((row for _, row, _ in cells), default=-1) + 1
+
+    buffer = bytearray(LEVEL_HEADER.size + len(cells) * LEVEL_RECORD.size)
+    LEVEL_HEADER.pack_into(buffer, 0, LEVEL_MAGIC, LEVEL_VERSION, height, width, len(cells))
+    for i, (col, row, value) in enumerate(cells):
+        LEVEL_RECORD.pack_into(buffer, LEVEL_HEADER.size + i * LEVEL_RECORD.size, col, row, abs(value), FLAG_ROTATED if value < 0 else 0)
+
+    output_path = output_path or compiled_level_path(csv_path)
+    with open(output_path, "wb") as file: file.write(buffer)
+    return output_path
\ No newline at end of file
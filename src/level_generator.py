@@ -0,0 +1,25 @@
+import csv
+import random
+
+from src.constants import SCREEN_SIZE, SPRITE_SIZE
+
+# Rows above the floor, and the first screen of columns the player falls through at spawn,
+# are kept free of blocks and spikes so a run without input survives to the portal
+LANE_ROWS = 6
+SPAWN_COLUMNS = SCREEN_SIZE[0] // SPRITE_SIZE[0]
+TILE_WEIGHTS = {1: 6, 2: 2, -2: 1, 3: 1}
+
+def generate_level(path: str, columns: int, density: float = 0.2, seed: int = 0, rows: int = SCREEN_SIZE[1] // SPRITE_SIZE[1]) -> str:
+    rng = random.Random(seed)
+    kinds, weights = list(TILE_WEIGHTS), list(TILE_WEIGHTS.values())
+    lane_top = rows - 1 - LANE_ROWS
+
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        for row in range(rows - 1):
+            if row < lane_top: cells = [rng.choices(kinds, weights)[0] if col >= SPAWN_COLUMNS and rng.random() < density else 0 for col in range(columns)]
+            else: cells = [3 if row == rows - 2 and rng.random() < density / 4 else 0 for _ in range(columns)]
+            if row == rows - 3: cells[columns - 2] = 4
+            writer.writerow(cells)
+        writer.writerow([1] * columns)
+    return path
\ No newline at end of file
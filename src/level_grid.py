@@ -0,0 +1,37 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+from src.level_reader import Cell, iter_csv_cells, iter_binary_cells, LEVEL_EXTENSION
+
+class LevelGrid:
+    def __init__(self, cells: Iterable[Cell]) -> None:
+        ordered = sorted(cells)
+        self._cols = array("I", (col for col, _, _ in ordered))
+        self._rows = array("H", (row for _, row, _ in ordered))
+        self._values = array("b", (value for _, _, value in ordered))
+
+    @classmethod
+    def from_file(cls, filename: str) -> "LevelGrid":
+        return cls(iter_binary_cells(filename) if filename.endswith(LEVEL_EXTENSION) else iter_csv_cells(filename))
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Cell]:
+        return zip(self._cols, self._rows, self._values)
+
+    @property
+    def width(self) -> int:
+        return self._cols[-1] + 1 if self._cols else 0
+
+    @property
+    def height(self) -> int:
+        return max(self._rows, default=-1) + 1
+
+    def columns(self, start: int, end: int) -> Iterator[Cell]:
+        first, last = bisect_left(self._cols, start), bisect_left(self._cols, end)
+        return zip(self._cols[first:last], self._rows[first:last], self._values[first:last])
+
+    def find(self, value: int) -> Cell | None:
+        return next((cell for cell in self if abs(cell[2]) == value), None)
\ No newline at end of file
@@ -1,38 +1,100 @@
+import os
 import csv
+import mmap
+import struct
 import pygame
 
+from typing import Iterable, Iterator
+
 from src.image_manager import ImageManager
+from src.spatial_index import SpatialIndex
 from src.entities import Block, Spike, Coin, Portal, Obstacle
 from src.constants import SPRITE_SIZE, SPIKE_IMAGE_PATH, COIN_IMAGE_PATH, PORTAL_IMAGE_PATH, BLOCK_IMAGE_PATH
 
-def load_level_from_csv(filename: str, image_manager: ImageManager, group) -> list[Obstacle]:
-    obstacles: list[Obstacle] = []
+# Compiled level layout: header, then one fixed-size record per non-empty cell
+LEVEL_MAGIC = b"PYDL"
+LEVEL_VERSION = 1
+LEVEL_EXTENSION = ".pydl"
+LEVEL_HEADER = struct.Struct("<4sBxHII")  # magic, version, height, width, record count
+LEVEL_RECORD = struct.Struct("<IHBB")     # column, row, type, flags
+FLAG_ROTATED = 1
 
-    with open(filename, newline='') as csvfile:
-        reader = csv.reader(csvfile)
+Cell = tuple[int, int, int]
 
-        for row_idx, row in enumerate(reader):
+def iter_csv_cells(filename: str) -> Iterator[Cell]:
+    with open(filename, newline='') as csvfile:
+        for row_idx, row in enumerate(csv.reader(csvfile)):
             for col_idx, cell in enumerate(row):
+                if cell == "0": continue
 
                 try: value = int(cell)
                 except ValueError: continue
 
-                x = col_idx * SPRITE_SIZE[0]
-                y = row_idx * SPRITE_SIZE[1]
+                # Values with no tile type are ignored (they would not fit LevelGrid or compiled records either)
+                if abs(value) in TILE_TYPES: yield col_idx, row_idx, value
+
+def iter_binary_cells(filename: str) -> Iterator[Cell]:
+    with open(filename, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if len(buffer) < LEVEL_HEADER.size: raise ValueError(f"{filename} is truncated")
+        magic, version, _, _, count = LEVEL_HEADER.unpack_from(buffer, 0)
+        if magic != LEVEL_MAGIC or version != LEVEL_VERSION: raise ValueError(f"{filename} is not a compiled level (version {LEVEL_VERSION})")
+        if LEVEL_HEADER.size + count * LEVEL_RECORD.size > len(buffer): raise ValueError(f"{filename} is truncated")
+
+        for offset in range(LEVEL_HEADER.size, LEVEL_HEADER.size + count * LEVEL_RECORD.size, LEVEL_RECORD.size):
+            col, row, kind, flags = LEVEL_RECORD.unpack_from(buffer, offset)
+            if kind in TILE_TYPES: yield col, row, -kind if flags & FLAG_ROTATED else kind
+
+# Tile value -> obstacle type, image, size and whether a negative value flips it
+TILE_TYPES: dict[int, tuple[type[Obstacle], str, tuple[int, int], bool]] = {
+    1: (Block, BLOCK_IMAGE_PATH, SPRITE_SIZE, False),
+    2: (Spike, SPIKE_IMAGE_PATH, SPRITE_SIZE, True),
+    3: (Coin, COIN_IMAGE_PATH, SPRITE_SIZE, False),
+    4: (Portal, PORTAL_IMAGE_PATH, (32, 64), False),
+}
+
+def tile_assets(value: int, image_manager: ImageManager) -> tuple[type[Obstacle], pygame.Surface, pygame.Mask] | None:
+    tile = TILE_TYPES.get(abs(value))
+    if not tile: return None
+
+    obstacle_type, path, size, flippable = tile
+    rotation = 180 if value < 0 and flippable else 0
+    return obstacle_type, image_manager.get(path, size, rotation), image_manager.get_mask(path, size, rotation)
+
+def create_obstacle(col: int, row: int, value: int, image_manager: ImageManager, group) -> Obstacle | None:
+    assets = tile_assets(value, image_manager)
+    if not assets: return None
+
+    obstacle_type, image, mask = assets
+    return obstacle_type(image, pygame.math.Vector2(col * SPRITE_SIZE[0], row * SPRITE_SIZE[1]), group, mask=mask)
+
+def build_level(cells: Iterable[Cell], image_manager: ImageManager, group, index: SpatialIndex | None = None) -> list[Obstacle]:
+    obstacles: list[Obstacle] = []
+
+    for col, row, value in cells:
+        obj = create_obstacle(col, row, value, image_manager, group)
+        if not obj: continue
+        obstacles.append(obj)
+        if index is not None: index.insert(obj)
+
+    return obstacles
 
-                should_rotate = value < 0
-                value = abs(value)
-                obj = None
+def load_level_from_csv(filename: str, image_manager: ImageManager, group, index: SpatialIndex | None = None) -> list[Obstacle]:
+    return build_level(iter_csv_cells(filename), image_manager, group, index)
 
-                if value == 0: continue
-                elif value == 1: obj = Block(image_manager.get(BLOCK_IMAGE_PATH, SPRITE_SIZE), pygame.math.Vector2(x, y), group)
-                elif value == 2:
-                    image = image_manager.get(SPIKE_IMAGE_PATH, SPRITE_SIZE)
-                    if should_rotate: image = pygame.transform.rotate(image, 180)
-                    obj = Spike(image, pygame.math.Vector2(x, y), group)
-                elif value == 3: obj = Coin(image_manager.get(COIN_IMAGE_PATH, SPRITE_SIZE), pygame.math.Vector2(x, y), group)
-                elif value == 4: obj = Portal(image_manager.get(PORTAL_IMAGE_PATH, (32, 64)), pygame.math.Vector2(x, y), group)
+def compiled_level_path(filename: str) -> str:
+    return os.path.splitext(filename)[0] + LEVEL_EXTENSION
 
-                if obj: obstacles.append(obj)
+def is_compiled_level(filename: str) -> bool:
+    try:
+        with open(filename, "rb") as file: header = file.read(LEVEL_HEADER.size)
+        if len(header) < LEVEL_HEADER.size: return False
+        magic, version, _, _, count = LEVEL_HEADER.unpack(header)
+        return magic == LEVEL_MAGIC and version == LEVEL_VERSION and os.path.getsize(filename) >= LEVEL_HEADER.size + count * LEVEL_RECORD.size
+    except OSError: return False
 
-    return obstacles
\ No newline at end of file
+def resolve_level_path(filename: str) -> str:
+    # The CSV is the source of truth; a stale, foreign or truncated compiled level is ignored
+    if filename.endswith(LEVEL_EXTENSION): return filename
+    compiled = compiled_level_path(filename)
+    if os.path.exists(compiled) and os.path.getmtime(compiled) >= os.path.getmtime(filename) and is_compiled_level(compiled): return compiled
+    return filename
\ No newline at end of file
@@ -0,0 +1,41 @@
+import pygame
+
+from src.level_grid import LevelGrid
+from src.image_manager import ImageManager
+from src.spatial_index import SpatialIndex
+from src.level_reader import build_level
+from src.entities import Obstacle
+from src.constants import SPRITE_SIZE, STREAM_CHUNK_COLUMNS
+
+class LevelStream:
+    def __init__(self, grid: LevelGrid, image_manager: ImageManager, group: pygame.sprite.Group, index: SpatialIndex, chunk_columns: int = STREAM_CHUNK_COLUMNS) -> None:
+        self._grid = grid
+        self._image_manager = image_manager
+        self._group = group
+        self._index = index
+        self._chunk_columns = chunk_columns
+        self._chunk_width = chunk_columns * SPRITE_SIZE[0]
+
+        self._chunks: dict[int, list[Obstacle]] = {}
+        self._next_chunk = 0
+
+    def _spawn(self, chunk: int) -> None:
+        cells = self._grid.columns(chunk * self._chunk_columns, (chunk + 1) * self._chunk_columns)
+        self._chunks[chunk] = build_level(cells, self._image_manager, self._group, self._index)
+
+    def _release(self, chunk: int) -> None:
+        for obstacle in self._chunks.pop(chunk):
+            self._index.remove(obstacle)
+            obstacle.kill()
+
+    def update(self, viewport: pygame.Rect) -> None:
+        for chunk in [chunk for chunk in self._chunks if (chunk + 1) * self._chunk_width <= viewport.left]: self._release(chunk)
+
+        last_chunk = min(viewport.right // self._chunk_width + 1, (self._grid.width - 1) // self._chunk_columns)
+        while self._next_chunk <= last_chunk:
+            self._spawn(self._next_chunk)
+            self._next_chunk += 1
+
+    def reset(self) -> None:
+        for chunk in list(self._chunks): self._release(chunk)
+        self._next_chunk = 0
\ No newline at end of file
@@ -0,0 +1,191 @@
+import math
+import time
+import numpy as np
+
+from multiprocessing.pool import Pool
+from typing import NamedTuple
+
+from src.level_grid import LevelGrid
+from src.image_manager import ImageManager
+from src.level_reader import resolve_level_path
+from src.batch_simulation import BatchSimulator, BatchState
+from src.simulation import Simulation
+from src.replay import InputRecording, play_back
+from src.constants import JUMP_COOLDOWN_TICKS, OBSTACLE_SPEED, SPRITE_SIZE, VERIFY_SEGMENT_COLUMNS, VERIFY_CHUNK_STATES
+
+RUNNING = Simulation.Status.RUNNING.value
+COMPLETED = Simulation.Status.COMPLETED.value
+
+# One search tick: the parent state and action of every surviving branch, and the
+# deduplicated child it led to (-1 when the branch reached the portal)
+Layer = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+class SegmentStats(NamedTuple):
+    index: int
+    first_tick: int
+    last_tick: int
+    entry_states: int
+    winning_states: int
+    peak_states: int
+    explored: int
+    deaths: int
+    mandatory_jumps: int
+
+class VerifyResult(NamedTuple):
+    level_path: str
+    completable: bool
+    ticks: int
+    trace: InputRecording | None
+    mandatory_jumps: list[int]
+    segments: list[SegmentStats]
+    verified: bool
+    seconds: float
+
+class _Chunk(NamedTuple):
+    layers: list[Layer]
+    sizes: list[int]
+    exit: BatchState
+    explored: int
+    deaths: int
+    peak: int
+
+class _Segment(NamedTuple):
+    first_tick: int
+    parts: list[np.ndarray]
+    chunks: list[_Chunk]
+    merged: np.ndarray
+
+_simulators: dict[str, BatchSimulator] = {}
+
+def _simulator(level_path: str) -> BatchSimulator:
+    simulator = _simulators.get(level_path)
+    if simulator is None: simulator = _simulators[level_path] = BatchSimulator(level_path, 1, ImageManager())
+    return simulator
+
+def _unique(state: BatchState) -> tuple[np.ndarray, np.ndarray]:
+    # Coins never change the outcome, so two states are the same once position, motion and jump cooldown match
+    if not len(state.y): return np.zeros(0, np.int64), np.zeros(0, np.int64)
+    cooldown = np.maximum(0, JUMP_COOLDOWN_TICKS - (state.tick - state.last_jump_tick))
+    keys = np.column_stack((state.y, state.velocity, state.angle, state.is_jumping, state.is_on_ground, cooldown))
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    return first, inverse.ravel()
+
+def _concatenate(states: list[BatchState]) -> BatchState:
+    latest = max(states, key=lambda state: state.tick)
+    return BatchState(latest.tick, latest.camera, *(np.concatenate(fields) for fields in zip(*(state[2:] for state in states))))
+
+def _explore(task: tuple[str, BatchState, int]) -> _Chunk:
+    level_path, frontier, end_tick = task
+    simulator = _simulator(level_path)
+    layers: list[Layer] = []
+    sizes: list[int] = []
+    explored = deaths = peak = 0
+
+    while frontier.tick < end_tick and len(frontier.y):
+        sizes.append(len(frontier.y))
+        simulator.restore(frontier.select(np.repeat(np.arange(len(frontier.y)), 2)))
+        simulator.step(np.tile([False, True], len(frontier.y)))
+        children = simulator.snapshot()
+
+        alive = np.flatnonzero(children.status == RUNNING)
+        won = np.flatnonzero(children.status == COMPLETED)
+        first, inverse = _unique(children.select(alive))
+        branches = np.concatenate((alive, won))
+        layers.append((branches // 2, branches % 2 == 1, np.concatenate((inverse, np.full(len(won), -1)))))
+
+        explored += len(children.y)
+        deaths += len(children.y) - len(branches)
+        frontier = children.select(alive[first])
+        peak = max(peak, len(first))
+    return _Chunk(layers, sizes, frontier, explored, deaths, peak)
+
+def _winning_edges(chunk: _Chunk, exit_wins: np.ndarray) -> tuple[list[np.ndarray], np.ndarray]:
+    wins = exit_wins
+    edges: list[np.ndarray] = []
+    for (parent, _, child), size in zip(reversed(chunk.layers), reversed(chunk.sizes)):
+        edge = child < 0
+        if len(wins): edge |= (child >= 0) & wins[np.maximum(child, 0)]
+        wins = np.zeros(size, bool)
+        wins[parent[edge]] = True
+        edges.append(edge)
+    return edges[::-1], wins
+
+def verify_level(level_path: str, pool: Pool | None = None, processes: int = 1, segment_columns: int = VERIFY_SEGMENT_COLUMNS, chunk_states: int = VERIFY_CHUNK_STATES, image_manager: ImageManager | None = None) -> VerifyResult:
+    started = time.perf_counter()
+    grid = LevelGrid.from_file(resolve_level_path(level_path))
+    has_goal = grid.find(4) is not None
+    final_tick = math.ceil(grid.width * SPRITE_SIZE[0] / -OBSTACLE_SPEED)
+    segment_ticks = max(1, math.ceil(segment_columns * SPRITE_SIZE[0] / -OBSTACLE_SPEED))
+
+    # Breadth-first over ticks, one pool round per segment; workers deduplicate within their share of
+    # the frontier and the merged exit states seed the next segment. Without a pool the search runs in-process
+    frontier = BatchSimulator(level_path, 1, image_manager or ImageManager()).snapshot()
+    searched: list[_Segment] = []
+    furthest = 0
+    for first_tick in range(0, final_tick, segment_ticks):
+        if not len(frontier.y): break
+        parts = np.array_split(np.arange(len(frontier.y)), max(1, min(processes, len(frontier.y) // chunk_states)))
+        tasks = [(level_path, frontier.select(part), min(first_tick + segment_ticks, final_tick)) for part in parts]
+        chunks = pool.map(_explore, tasks) if pool else [_explore(task) for task in tasks]
+
+        merged = _concatenate([chunk.exit for chunk in chunks])
+        first, inverse = _unique(merged)
+        frontier = merged.select(first)
+        furthest = max(furthest, merged.tick)
+        searched.append(_Segment(first_tick, parts, chunks, inverse))
+
+    # Backwards: which states can still finish, and which branches lead there
+    wins = np.full(len(frontier.y), not has_goal and frontier.tick >= final_tick)
+    winning: list[list[list[np.ndarray]]] = []
+    entry_wins: list[int] = []
+    for segment in reversed(searched):
+        exit_wins = wins[segment.merged] if len(segment.merged) else np.zeros(0, bool)
+        bounds = np.cumsum([0] + [len(chunk.exit.y) for chunk in segment.chunks])
+        wins = np.zeros(sum(len(part) for part in segment.parts), bool)
+        edges: list[list[np.ndarray]] = []
+        for chunk, part, start, end in zip(segment.chunks, segment.parts, bounds, bounds[1:]):
+            chunk_edges, wins[part] = _winning_edges(chunk, exit_wins[start:end])
+            edges.append(chunk_edges)
+        winning.append(edges)
+        entry_wins.append(int(np.count_nonzero(wins)))
+    winning.reverse()
+    entry_wins.reverse()
+
+    completable = bool(len(wins) and wins[0])
+
+    # Forwards: follow winning branches from the spawn, jumping only when not jumping from that exact
+    # state dies or can no longer win, which is what makes the jump mandatory
+    trace = None
+    mandatory: list[int] = []
+    if completable:
+        trace = InputRecording(level_path)
+        node = 0
+        for segment, edges in zip(searched, winning):
+            bounds = np.cumsum([0] + [len(chunk.exit.y) for chunk in segment.chunks])
+            c = next(c for c, part in enumerate(segment.parts) if part[0] <= node <= part[-1])
+            local = node - int(segment.parts[c][0])
+            for (parent, action, child), edge in zip(segment.chunks[c].layers, edges[c]):
+                options = np.flatnonzero((parent == local) & edge)
+                stays = options[~action[options]]
+                choice = stays[0] if len(stays) else options[0]
+                trace.record(bool(action[choice]))
+                if not len(stays): mandatory.append(len(trace))
+                local = int(child[choice])
+                if local < 0: break
+            if local < 0: break
+            node = int(segment.merged[bounds[c] + local])
+
+    verified = False
+    if trace is not None:
+        result = play_back(trace, image_manager or ImageManager())
+        verified = result.status == (Simulation.Status.COMPLETED if has_goal else Simulation.Status.RUNNING) and result.ticks == len(trace)
+
+    segments = []
+    for index, (segment, entries) in enumerate(zip(searched, entry_wins)):
+        last_tick = max(chunk.exit.tick for chunk in segment.chunks)
+        segments.append(SegmentStats(index, segment.first_tick, last_tick, sum(len(part) for part in segment.parts), entries, max(chunk.peak for chunk in segment.chunks), sum(chunk.explored for chunk in segment.chunks), sum(chunk.deaths for chunk in segment.chunks), sum(1 for tick in mandatory if segment.first_tick < tick <= last_tick)))
+    return VerifyResult(level_path, completable, len(trace) if trace else furthest, trace, mandatory, segments, verified, time.perf_counter() - started)
+
+def verify_task(task: tuple[str, int]) -> VerifyResult:
+    level_path, segment_columns = task
+    return verify_level(level_path, segment_columns=segment_columns)
\ No newline at end of file
@@ -0,0 +1,105 @@
+import numpy as np
+import pygame
+
+from typing import Iterable
+from itertools import chain
+
+from src.level_grid import LevelGrid
+from src.image_manager import ImageManager
+from src.level_reader import TILE_TYPES, tile_assets
+from src.entities import Obstacle
+from src.spatial_index import ALL_BEHAVIOURS
+from src.constants import SPRITE_SIZE
+
+class ObstacleStore:
+    def __init__(self, grid: LevelGrid, image_manager: ImageManager) -> None:
+        self._image_manager = image_manager
+
+        cells = np.fromiter(chain.from_iterable(grid), np.int32, len(grid) * 3).reshape(-1, 3)
+        cells = cells[np.isin(np.abs(cells[:, 2]), list(TILE_TYPES))]
+        sizes = np.array([TILE_TYPES[value][2] if value in TILE_TYPES else (0, 0) for value in range(max(TILE_TYPES) + 1)], np.int16)
+        behaviours = np.array([TILE_TYPES[value][0].behaviour.value if value in TILE_TYPES else 0 for value in range(max(TILE_TYPES) + 1)], np.int8)
+
+        self._x = cells[:, 0] * SPRITE_SIZE[0]
+        self._y = cells[:, 1] * SPRITE_SIZE[1]
+        self._kind = cells[:, 2].astype(np.int8)
+        self._width = sizes[np.abs(self._kind), 0]
+        self._height = sizes[np.abs(self._kind), 1]
+        self._behaviour = behaviours[np.abs(self._kind)]
+        self._active = np.ones(len(cells), bool)
+        self._max_width = int(self._width.max(initial=0))
+
+        # First obstacle index of every column, so range lookups need no search
+        self._column_start: list[int] = self._x.searchsorted(np.arange(grid.width + 2) * SPRITE_SIZE[0]).tolist()
+
+        self._proxies: dict[int, Obstacle] = {}
+        self._proxy_index: dict[int, int] = {}
+        self._released_until = 0
+        self._extras: list[Obstacle] = []
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._active)) + len(self._extras)
+
+    @property
+    def proxies(self) -> int:
+        return len(self._proxies)
+
+    def _proxy(self, i: int) -> Obstacle:
+        proxy = self._proxies.get(i)
+        if proxy is not None: return proxy
+
+        obstacle_type, image, mask = tile_assets(int(self._kind[i]), self._image_manager)
+        proxy = self._proxies[i] = obstacle_type(image, pygame.math.Vector2(int(self._x[i]), int(self._y[i])), mask=mask)
+        self._proxy_index[id(proxy)] = i
+        return proxy
+
+    def insert(self, obstacle: Obstacle) -> None:
+        i = self._proxy_index.get(id(obstacle))
+        if i is not None: self._active[i] = True
+        elif obstacle not in self._extras: self._extras.append(obstacle)
+
+    def remove(self, obstacle: Obstacle) -> None:
+        i = self._proxy_index.get(id(obstacle))
+        if i is not None: self._active[i] = False
+        elif obstacle in self._extras: self._extras.remove(obstacle)
+
+    def activate(self, obstacle: Obstacle) -> None:
+        obstacle.is_active = True
+        self.insert(obstacle)
+
+    def deactivate(self, obstacle: Obstacle) -> None:
+        obstacle.is_active = False
+        i = self._proxy_index.get(id(obstacle))
+        if i is not None: self._active[i] = False
+
+    def clear(self) -> None:
+        self._active[:] = False
+        self._extras.clear()
+
+    def _first_at(self, x: int) -> int:
+        column = min(max(0, -(-x // SPRITE_SIZE[0])), len(self._column_start) - 1)
+        return self._column_start[column]
+
+    def release(self, left: int) -> None:
+        end = self._first_at(left - self._max_width)
+        for i in range(self._released_until, end):
+            proxy = self._proxies.get(i)
+            if proxy is None or not self._active[i]: continue
+            del self._proxies[i]
+            del self._proxy_index[id(proxy)]
+        self._released_until = end
+
+    def query(self, rect: pygame.Rect, behaviours: Iterable[Obstacle.Behaviour] = ALL_BEHAVIOURS) -> list[Obstacle]:
+        behaviours = tuple(behaviours)
+        extras = [obstacle for obstacle in self._extras if obstacle.behaviour in behaviours and obstacle.is_active and obstacle.rect.colliderect(rect)] if self._extras else []
+        if rect.width <= 0 or rect.height <= 0: return extras
+
+        first, last = self._first_at(rect.left - self._max_width + 1), self._first_at(rect.right)
+        y = self._y[first:last]
+        hits = (self._x[first:last] + self._width[first:last] > rect.left) & (y < rect.bottom) & (y + self._height[first:last] > rect.top) & self._active[first:last]
+
+        indices = (hits.nonzero()[0] + first).tolist()
+        if len(indices) > 1 or behaviours != ALL_BEHAVIOURS:
+            rank = {behaviour.value: n for n, behaviour in enumerate(behaviours)}
+            indices = sorted((i for i in indices if int(self._behaviour[i]) in rank), key=lambda i: rank[int(self._behaviour[i])])
+        return [self._proxy(i) for i in indices] + extras
\ No newline at end of file
@@ -0,0 +1,88 @@
+import numpy as np
+import pygame
+
+from src.constants import PARTICLE_CAPACITY, PARTICLE_MAX_SIZE
+
+class ParticleSystem:
+    def __init__(self, capacity: int = PARTICLE_CAPACITY, seed: int | None = None) -> None:
+        self._capacity = capacity
+        self._count = 0
+        self._rng = np.random.default_rng(seed)
+
+        self._position = np.zeros((capacity, 2), np.float32)
+        self._velocity = np.zeros((capacity, 2), np.float32)
+        self._acceleration = np.zeros((capacity, 2), np.float32)
+        self._life = np.zeros(capacity, np.float32)
+        self._decay = np.zeros(capacity, np.float32)
+        self._color = np.zeros(capacity, np.uint8)
+
+        self._palette: list[tuple[int, int, int]] = []
+        self._squares: list[pygame.Surface] = []
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _color_index(self, color: tuple[int, int, int]) -> int:
+        if color in self._palette: return self._palette.index(color)
+
+        self._palette.append(color)
+        for size in range(PARTICLE_MAX_SIZE + 1):
+            square = pygame.Surface((size, size))
+            square.fill(color)
+            self._squares.append(square)
+        return len(self._palette) - 1
+
+    def emit(self, position: tuple[float, float], velocity: np.ndarray, life: np.ndarray, color: tuple[int, int, int], acceleration: tuple[float, float] = (0, 0), decay: float = 0.2) -> None:
+        count = min(len(life), self._capacity - self._count)
+        if count <= 0: return
+
+        batch = slice(self._count, self._count + count)
+        self._position[batch] = position
+        self._velocity[batch] = velocity[:count]
+        self._acceleration[batch] = acceleration
+        self._life[batch] = life[:count]
+        self._decay[batch] = decay
+        self._color[batch] = self._color_index(color)
+        self._count += count
+
+    def emit_trail(self, position: tuple[float, float], color: tuple[int, int, int]) -> None:
+        velocity = np.zeros((1, 2), np.float32)
+        velocity[:, 0] = self._rng.integers(0, 26, 1) // 10 - 1
+        self.emit(position, velocity, self._rng.integers(5, 9, 1).astype(np.float32), color, acceleration=(-0.1, 0))
+
+    def burst(self, position: tuple[float, float], count: int, color: tuple[int, int, int], speed: float = 4, gravity: float = 0.2) -> None:
+        angle = self._rng.uniform(0, 2 * np.pi, count)
+        magnitude = self._rng.uniform(0.3, 1, count) * speed
+        velocity = np.stack((np.cos(angle) * magnitude, np.sin(angle) * magnitude), axis=1)
+        self.emit(position, velocity, self._rng.uniform(3, PARTICLE_MAX_SIZE, count).astype(np.float32), color, acceleration=(0, gravity), decay=0.15)
+
+    def update(self) -> None:
+        n = self._count
+        if not n: return
+
+        self._position[:n] += self._velocity[:n]
+        self._velocity[:n] += self._acceleration[:n]
+        self._life[:n] -= self._decay[:n]
+
+        alive = self._life[:n] > 0
+        self._count = int(alive.sum())
+        if self._count == n: return
+        for array in (self._position, self._velocity, self._acceleration, self._life, self._decay, self._color): array[:self._count] = array[:n][alive]
+
+    def clear(self) -> None:
+        self._count = 0
+
+    def draw(self, surface: pygame.Surface) -> pygame.Rect | None:
+        n = self._count
+        sizes = np.minimum(self._life[:n], PARTICLE_MAX_SIZE).astype(np.int32)
+        drawn = sizes > 0
+        if not drawn.any(): return None
+
+        positions = self._position[:n][drawn].astype(np.int32)
+        sizes = sizes[drawn]
+        squares = self._color[:n][drawn].astype(np.int32) * (PARTICLE_MAX_SIZE + 1) + sizes
+        surface.blits(zip(map(self._squares.__getitem__, squares.tolist()), positions.tolist()), doreturn=False)
+
+        low = positions.min(axis=0)
+        high = (positions + sizes[:, None]).max(axis=0)
+        return pygame.Rect(int(low[0]), int(low[1]), int(high[0] - low[0]), int(high[1] - low[1])).clip(surface.get_rect())
\ No newline at end of file
@@ -0,0 +1,69 @@
+import json
+
+from time import perf_counter_ns
+from contextlib import nullcontext
+from collections import deque
+
+from src.constants import PROFILER_WINDOW
+
+class _Section:
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "Profiler", name: str) -> None:
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._start = perf_counter_ns()
+
+    def __exit__(self, *exc_info) -> None:
+        self._profiler.record(self._name, self._start, perf_counter_ns())
+
+_NO_SECTION = nullcontext()
+
+class Profiler:
+    def __init__(self, enabled: bool = True, trace_path: str = "", window: int = PROFILER_WINDOW) -> None:
+        self._enabled = enabled
+        self._trace_path = trace_path
+        self._window = window
+
+        self._samples: dict[str, deque[int]] = {}
+        self._frame_times: deque[int] = deque(maxlen=window)
+        self._last_frame = perf_counter_ns()
+        self._origin = self._last_frame
+        self._events: list[tuple[str, int, int]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def section(self, name: str) -> _Section | nullcontext:
+        return _Section(self, name) if self._enabled else _NO_SECTION
+
+    def record(self, name: str, start: int, end: int) -> None:
+        samples = self._samples.get(name)
+        if samples is None: samples = self._samples[name] = deque(maxlen=self._window)
+        samples.append(end - start)
+        if self._trace_path: self._events.append((name, start, end))
+
+    def end_frame(self) -> None:
+        now = perf_counter_ns()
+        self._frame_times.append(now - self._last_frame)
+        self._last_frame = now
+
+    @property
+    def fps(self) -> float:
+        if not self._frame_times: return 0.0
+        return len(self._frame_times) * 1e9 / sum(self._frame_times)
+
+    def stats(self) -> list[tuple[str, float, float]]:
+        stats = []
+        for name, samples in self._samples.items():
+            ordered = sorted(samples)
+            stats.append((name, ordered[len(ordered) // 2] / 1e6, ordered[min(len(ordered) - 1, len(ordered) * 99 // 100)] / 1e6))
+        return stats
+
+    def save_trace(self) -> None:
+        if not self._trace_path: return
+        events = [{"name": name, "ph": "X", "ts": (start - self._origin) / 1000, "dur": (end - start) / 1000, "pid": 0, "tid": 0} for name, start, end in self._events]
+        with open(self._trace_path, "w") as file: json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
\ No newline at end of file
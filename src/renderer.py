@@ -1,23 +1,90 @@
-import os
 import pygame
 
+from typing import Callable
+from collections import OrderedDict
+
+from src.camera import Camera
+from src.tile_chunks import TileChunk
 from src.entities.player import Player
 from src.entities.obstacle import Obstacle
-from src.constants import SCREEN_SIZE, PROJECT_DIR
-from src.constants import RED, GREEN, BLACK, PURPLE, LIME, WHITE, BLUE_SEMI_TRANSPARENT, YELLOW_SEMI_TRANSPARENT, DARK_YELLOW
+from src.profiler import Profiler
+from src.font_manager import FontManager
+from src.level_catalogue import LevelEntry
+from src.constants import SCREEN_SIZE, FONT_PATH, TEXT_CACHE_SIZE, MASK_OVERLAY_CACHE_SIZE, THUMBNAIL_SIZE, MENU_VISIBLE_LEVELS
+from src.constants import RED, GREEN, BLACK, PURPLE, LIME, WHITE, ORANGE, CYAN, BLUE_SEMI_TRANSPARENT, YELLOW_SEMI_TRANSPARENT, DARK_YELLOW, PROFILER_PANEL
 
 class Renderer:
-    def __init__(self, screen: pygame.Surface) -> None:
+    def __init__(self, screen: pygame.Surface, background: pygame.Surface, dirty_rects: bool = False, fonts: FontManager | None = None) -> None:
         self._screen = screen
+        self._background = background
+
+        self._dirty_rects = dirty_rects
+        self._dirty: list[pygame.Rect] = []
+        self._previous_dirty: list[pygame.Rect] = []
+        self._backdrop: pygame.Surface | None = None
+
+        self._text_cache: OrderedDict[tuple[str, pygame.font.Font, tuple[int, int, int], bool], pygame.Surface] = OrderedDict()
+        self._menu_key: tuple | None = None
+        self._menu_surface: pygame.Surface | None = None
+        self._mask_overlays: OrderedDict[tuple[int, tuple[int, int, int, int]], tuple[pygame.Mask, pygame.Surface]] = OrderedDict()
+
+        fonts = fonts or FontManager()
+        self._big_font = fonts.get(FONT_PATH, 60)
+        self._mid_font = fonts.get(FONT_PATH, 48)
+        self._small_font = fonts.get(FONT_PATH, 36)
+        self._info_font = fonts.get(FONT_PATH, 28)
+        self._debug_font = fonts.get(None, 20)
 
-        self._big_font = pygame.font.Font(os.path.join(PROJECT_DIR, "resources/fonts/PUSAB_.ttf"), 60)
-        self._mid_font = pygame.font.Font(os.path.join(PROJECT_DIR, "resources/fonts/PUSAB_.ttf"), 48)
-        self._small_font = pygame.font.Font(os.path.join(PROJECT_DIR, "resources/fonts/PUSAB_.ttf"), 36)
+    def render_text(self, text: str, font: pygame.font.Font, color: tuple[int, int, int], antialias: bool = True) -> pygame.Surface:
+        cache_key = (text, font, color, antialias)
+        text_obj = self._text_cache.get(cache_key)
+        if text_obj is not None:
+            self._text_cache.move_to_end(cache_key)
+            return text_obj
+
+        text_obj = font.render(text, antialias, color)
+        self._text_cache[cache_key] = text_obj
+        if len(self._text_cache) > TEXT_CACHE_SIZE: self._text_cache.popitem(last=False)
+        return text_obj
+
+    def _blit_text(self, surface: pygame.Surface, text: str, font: pygame.font.Font, color: tuple[int, int, int], x: int, y: int) -> pygame.Rect:
+        text_obj = self.render_text(text, font, color)
+        return surface.blit(text_obj, text_obj.get_rect(center=(x, y)))
 
     def draw_text(self, text: str, font: pygame.font.Font, color: tuple[int, int, int], x: int, y: int) -> None:
-        text_obj = font.render(text, True, color)
-        text_rect = text_obj.get_rect(center=(x, y))
-        self._screen.blit(text_obj, text_rect)
+        self.mark_dirty(self._blit_text(self._screen, text, font, color, x, y))
+
+    def mark_dirty(self, *rects: pygame.Rect | None) -> None:
+        if self._dirty_rects: self._dirty.extend(rect for rect in rects if rect)
+
+    def _blits(self, sequence: list[tuple[pygame.Surface, pygame.Rect]]) -> None:
+        rects = self._screen.blits(sequence, doreturn=self._dirty_rects)
+        if rects: self._dirty.extend(rects)
+
+    def _draw_backdrop(self, backdrop: pygame.Surface) -> None:
+        if not self._dirty_rects or backdrop is not self._backdrop:
+            self._dirty.append(self._screen.blit(backdrop, (0, 0)))
+            self._backdrop = backdrop
+            return
+        self._screen.blits([(backdrop, rect, rect) for rect in self._previous_dirty], doreturn=False)
+
+    def present(self) -> None:
+        if not self._dirty_rects:
+            pygame.display.flip()
+            return
+
+        pygame.display.update(self._previous_dirty + self._dirty)
+        self._previous_dirty, self._dirty = self._dirty, []
+
+    def draw_background(self) -> None:
+        self._draw_backdrop(self._background)
+
+    def _draw_menu(self, menu_key: tuple, compose: Callable[[pygame.Surface], None]) -> None:
+        if menu_key != self._menu_key:
+            self._menu_surface = self._background.copy()
+            compose(self._menu_surface)
+            self._menu_key = menu_key
+        self._draw_backdrop(self._menu_surface)
 
     def draw_progress_bar(self, bar_width: int = 600, bar_height: int = 10, color: tuple[int, int, int] = LIME, current_distance: int | None = None, initial_portal_distance: int | None = None) -> None:
         if not current_distance or not initial_portal_distance: return
@@ -27,41 +94,97 @@ class Renderer:
         outline_rect = pygame.Rect(100, 20, bar_width, bar_height)
         fill_rect = pygame.Rect(100, 20, fill_width, bar_height)
         pygame.draw.rect(self._screen, color, fill_rect)
-        pygame.draw.rect(self._screen, WHITE, outline_rect, 2)
+        self.mark_dirty(pygame.draw.rect(self._screen, WHITE, outline_rect, 2))
+
+    def mask_overlay(self, mask: pygame.Mask, color: tuple[int, int, int, int] = BLUE_SEMI_TRANSPARENT) -> pygame.Surface:
+        # Masks can't be weakly referenced, so the entry holds the mask to keep its id from being reused
+        cache_key = (id(mask), color)
+        entry = self._mask_overlays.get(cache_key)
+        if entry is not None:
+            self._mask_overlays.move_to_end(cache_key)
+            return entry[1]
+
+        overlay = mask.to_surface(setcolor=color, unsetcolor=BLACK)
+        overlay.set_colorkey(BLACK)
+        overlay.set_alpha(100)
+        self._mask_overlays[cache_key] = (mask, overlay)
+        if len(self._mask_overlays) > MASK_OVERLAY_CACHE_SIZE: self._mask_overlays.popitem(last=False)
+        return overlay
 
     def draw_mask(self, mask: pygame.Mask, rect: pygame.rect.Rect, color: tuple[int, int, int, int] = BLUE_SEMI_TRANSPARENT) -> None:
-        mask_surface = mask.to_surface(setcolor=color, unsetcolor=BLACK)
-        mask_surface.set_colorkey(BLACK)
-        mask_surface.set_alpha(100)
-        self._screen.blit(mask_surface, rect.topleft)
+        self.mark_dirty(self._screen.blit(self.mask_overlay(mask, color), rect.topleft))
 
-    def draw_bounding_boxes(self, player: Player, obstacles: list[Obstacle], contact_point: tuple[int, int] | None = None) -> None:
-        pygame.draw.rect(self._screen, RED, player.rect, 2)
+    def draw_obstacles(self, obstacles: list[Obstacle], camera: Camera, alpha: float = 1.0) -> None:
+        offset = -camera.offset(alpha)
+        self._blits([(obstacle.image, obstacle.rect.move(offset, 0)) for obstacle in obstacles])
+
+    def draw_tile_chunks(self, chunks: list[TileChunk], camera: Camera, alpha: float = 1.0) -> None:
+        offset = -camera.offset(alpha)
+        self._blits([(surface, rect.move(offset, 0)) for surface, rect in chunks])
+
+    def draw_bounding_boxes(self, player: Player, obstacles: list[Obstacle], camera: Camera, contact_point: tuple[int, int] | None = None, query_rects: list[pygame.Rect] | None = None, candidates: list[Obstacle] | None = None) -> None:
+        self.mark_dirty(pygame.draw.rect(self._screen, RED, player.rect, 2))
         self.draw_mask(player.mask, player.rect, color=BLUE_SEMI_TRANSPARENT)
+
+        screen_rect = self._screen.get_rect()
+        overlays: list[tuple[pygame.Surface, pygame.Rect]] = []
         for obstacle in obstacles:
-            pygame.draw.rect(self._screen, GREEN, obstacle.rect, 2)
-            if hasattr(obstacle, "mask"): self.draw_mask(obstacle.mask, obstacle.rect, color=YELLOW_SEMI_TRANSPARENT)
-        if contact_point: pygame.draw.circle(self._screen, PURPLE, contact_point, 5)
-
-    def draw_level_select_menu(self, available_levels: list[str], selected_level: int) -> None:
-        self.draw_text("Select Level", self._big_font, BLACK, SCREEN_SIZE[0] // 2, 120)
-        for i, level in enumerate(available_levels):
-            name = os.path.basename(level.split(".")[0])
-            color = BLACK
-            x = SCREEN_SIZE[0] // 2
-            y = 220 + i * 60
-            if i == selected_level: pygame.draw.rect(self._screen, DARK_YELLOW, (x - 220, y - 24, 440, 48))
-            self.draw_text(name, self._mid_font, color, x, y)
-        self.draw_text("Use Up/Down and Enter to select", self._small_font, BLACK, SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] - 60)
+            rect = camera.to_screen(obstacle.rect)
+            if not screen_rect.colliderect(rect): continue
+            self.mark_dirty(pygame.draw.rect(self._screen, GREEN, rect, 2))
+            if hasattr(obstacle, "mask"): overlays.append((self.mask_overlay(obstacle.mask, YELLOW_SEMI_TRANSPARENT), rect))
+        self._blits(overlays)
+
+        for rect in query_rects or (): self.mark_dirty(pygame.draw.rect(self._screen, ORANGE, camera.to_screen(rect), 1))
+        for obstacle in candidates or (): self.mark_dirty(pygame.draw.rect(self._screen, CYAN, camera.to_screen(obstacle.rect), 3))
+        if contact_point: self.mark_dirty(pygame.draw.circle(self._screen, PURPLE, contact_point, 5))
+
+    def draw_profiler_overlay(self, profiler: Profiler, x: int = 480, y: int = 40) -> None:
+        rows = [(f"FPS {profiler.fps:.1f}", "p50 ms", "p99 ms")] + [(name, f"{p50:.2f}", f"{p99:.2f}") for name, p50, p99 in profiler.stats()]
+        line_height = self._debug_font.get_linesize()
+
+        panel = pygame.Surface((SCREEN_SIZE[0] - x - 10, line_height * len(rows) + 8), pygame.SRCALPHA)
+        panel.fill(PROFILER_PANEL)
+        for i, row in enumerate(rows):
+            for column, text in zip((6, 190, 250), row): panel.blit(self._debug_font.render(text, True, WHITE), (column, 4 + i * line_height))
+        self.mark_dirty(self._screen.blit(panel, (x, y)))
+
+    def draw_level_select_menu(self, levels: list[LevelEntry], selected_level: int, thumbnail: pygame.Surface | None = None) -> None:
+        self._draw_menu(("level_select", tuple(levels), selected_level, thumbnail), lambda surface: self._compose_level_select_menu(surface, levels, selected_level, thumbnail))
+
+    def _compose_level_select_menu(self, surface: pygame.Surface, levels: list[LevelEntry], selected_level: int, thumbnail: pygame.Surface | None) -> None:
+        self._blit_text(surface, "Select Level", self._big_font, BLACK, SCREEN_SIZE[0] // 2, 120)
+
+        first = min(max(0, selected_level - MENU_VISIBLE_LEVELS // 2), max(0, len(levels) - MENU_VISIBLE_LEVELS))
+        x = 220
+        for i, level in enumerate(levels[first:first + MENU_VISIBLE_LEVELS], first):
+            y = 220 + (i - first) * 60
+            if i == selected_level: pygame.draw.rect(surface, DARK_YELLOW, (x - 180, y - 24, 360, 48))
+            self._blit_text(surface, level.name, self._mid_font, BLACK, x, y)
+        if first > 0: pygame.draw.polygon(surface, BLACK, [(x - 10, 184), (x + 10, 184), (x, 172)])
+        if first + MENU_VISIBLE_LEVELS < len(levels): pygame.draw.polygon(surface, BLACK, [(x - 10, 496), (x + 10, 496), (x, 508)])
+
+        if levels:
+            level = levels[selected_level]
+            panel = pygame.Rect(420, 196, THUMBNAIL_SIZE[0] + 20, THUMBNAIL_SIZE[1] + 20)
+            pygame.draw.rect(surface, WHITE, panel)
+            if thumbnail: surface.blit(thumbnail, thumbnail.get_rect(center=panel.center))
+            portal = f"column {level.portal_column}" if level.portal_column is not None else "none"
+            for i, line in enumerate((f"Length: {level.columns}", f"Coins: {level.coins}", f"Portal: {portal}")): self._blit_text(surface, line, self._info_font, BLACK, panel.centerx, panel.bottom + 30 + i * 36)
+
+        self._blit_text(surface, "Use Up/Down and Enter to select", self._small_font, BLACK, SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] - 60)
 
     def draw_game_over_menu(self, level_complete: bool, game_over_selection: int, points: int) -> None:
+        self._draw_menu(("game_over", level_complete, game_over_selection, points), lambda surface: self._compose_game_over_menu(surface, level_complete, game_over_selection, points))
+
+    def _compose_game_over_menu(self, surface: pygame.Surface, level_complete: bool, game_over_selection: int, points: int) -> None:
         title = "Level Complete!" if level_complete else "Game Over"
-        self.draw_text(title, self._big_font, BLACK, SCREEN_SIZE[0] // 2, 120)
+        self._blit_text(surface, title, self._big_font, BLACK, SCREEN_SIZE[0] // 2, 120)
         options = ["Retry", "Main Menu", "Quit"]
         for i, option in enumerate(options):
             x = SCREEN_SIZE[0] // 2
             y = 220 + i * 60
             color = BLACK
-            if i == game_over_selection: pygame.draw.rect(self._screen, DARK_YELLOW, (x - 220, y - 24, 440, 48))
-            self.draw_text(option, self._mid_font, color, x, y)
-        self.draw_text(f"Points: {points}", self._small_font, BLACK, SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] - 80)
\ No newline at end of file
+            if i == game_over_selection: pygame.draw.rect(surface, DARK_YELLOW, (x - 220, y - 24, 440, 48))
+            self._blit_text(surface, option, self._mid_font, color, x, y)
+        self._blit_text(surface, f"Points: {points}", self._small_font, BLACK, SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] - 80)
\ No newline at end of file
@@ -0,0 +1,88 @@
+import os
+import struct
+import hashlib
+
+from typing import Callable, Iterator, NamedTuple
+
+from src.image_manager import ImageManager
+from src.simulation import Simulation
+from src.constants import PROJECT_DIR
+
+REPLAY_MAGIC = b"PYDR"
+REPLAY_VERSION = 2
+REPLAY_HEADER = struct.Struct("<4sBxHI16s")  # magic, version, level path length, tick count, level digest
+REPLAY_HASH_INTERVAL = 60
+
+def level_digest(level_path: str) -> bytes:
+    with open(level_path, "rb") as file: return hashlib.blake2b(file.read(), digest_size=16).digest()
+
+class InputRecording:
+    def __init__(self, level_path: str, bits: bytes = b"", ticks: int = 0) -> None:
+        self._level_path = level_path
+        self._bits = bytearray(bits)
+        self._ticks = ticks
+
+    @property
+    def level_path(self) -> str:
+        return self._level_path
+
+    def __len__(self) -> int:
+        return self._ticks
+
+    def __getitem__(self, tick: int) -> bool:
+        if not 0 <= tick < self._ticks: return False
+        return bool(self._bits[tick >> 3] & (1 << (tick & 7)))
+
+    def __iter__(self) -> Iterator[bool]:
+        return (self[tick] for tick in range(self._ticks))
+
+    def record(self, jump: bool) -> None:
+        if self._ticks >> 3 >= len(self._bits): self._bits.append(0)
+        if jump: self._bits[self._ticks >> 3] |= 1 << (self._ticks & 7)
+        self._ticks += 1
+
+    def save(self, filename: str) -> None:
+        # Levels are stored relative to the project so recordings play back on any checkout
+        path = os.path.relpath(os.path.normpath(os.path.abspath(self._level_path)), PROJECT_DIR).encode()
+        with open(filename, "wb") as file:
+            file.write(REPLAY_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, len(path), self._ticks, level_digest(self._level_path)))
+            file.write(path)
+            file.write(self._bits)
+
+    @classmethod
+    def load(cls, filename: str) -> "InputRecording":
+        with open(filename, "rb") as file: data = file.read()
+        magic, version, path_length, ticks, digest = REPLAY_HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION: raise ValueError(f"{filename} is not a replay (version {REPLAY_VERSION})")
+        path_end = REPLAY_HEADER.size + path_length
+        level_path = os.path.normpath(os.path.join(PROJECT_DIR, data[REPLAY_HEADER.size:path_end].decode()))
+        if level_digest(level_path) != digest: raise ValueError(f"{filename} was recorded on a different version of {level_path}")
+        return cls(level_path, data[path_end:], ticks)
+
+class ReplayResult(NamedTuple):
+    status: Simulation.Status
+    ticks: int
+    points: int
+    hashes: list[tuple[int, str]]
+
+def state_bytes(simulation: Simulation) -> bytes:
+    player = simulation.player
+    state = [struct.pack("<IiddiBBB", simulation.tick, simulation.camera.x, player.position.y, player.velocity, player.rotation_angle, player.is_jumping, player.is_on_ground, player.is_dead)]
+    state.append(struct.pack("<iB", simulation.points, simulation.status.value))
+    for obstacle in sorted(simulation.visible_obstacles(), key=lambda obstacle: (obstacle.rect.x, obstacle.rect.y)): state.append(type(obstacle).__name__.encode() + struct.pack("<ii", obstacle.rect.x, obstacle.rect.y))
+    return b"".join(state)
+
+def play_back(recording: InputRecording, image_manager: ImageManager, hash_interval: int = REPLAY_HASH_INTERVAL, streaming: bool = False, on_tick: Callable[[Simulation], None] | None = None) -> ReplayResult:
+    simulation = Simulation(recording.level_path, image_manager, streaming)
+    rolling = hashlib.blake2b(digest_size=16)
+    hashes: list[tuple[int, str]] = []
+
+    for jump in recording:
+        status = simulation.step(jump)
+        if on_tick: on_tick(simulation)
+        if simulation.tick % hash_interval == 0 or status != Simulation.Status.RUNNING:
+            rolling.update(state_bytes(simulation))
+            hashes.append((simulation.tick, rolling.hexdigest()))
+        if status != Simulation.Status.RUNNING: break
+
+    return ReplayResult(simulation.status, simulation.tick, simulation.points, hashes)
\ No newline at end of file
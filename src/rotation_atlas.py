@@ -0,0 +1,50 @@
+import pygame
+
+from typing import NamedTuple
+from pygame.math import Vector2
+
+from src.constants import ROTATION_ANGLE
+
+class RotatedFrame(NamedTuple):
+    image: pygame.Surface
+    mask: pygame.Mask
+    offset: Vector2
+    bounds: pygame.Rect
+    full: bool
+
+class RotationAtlas:
+    def __init__(self, image: pygame.Surface, step: int = ROTATION_ANGLE) -> None:
+        self._image = image
+        self._step = step
+        self._frames: dict[int, RotatedFrame] = {}
+
+    @property
+    def image(self) -> pygame.Surface:
+        return self._image
+
+    def _bake(self, angle: int) -> RotatedFrame:
+        width, height = self._image.get_size()
+        origin_position = (width // 2, height // 2)
+        box = [Vector2(point) for point in [(0, 0), (width, 0), (width, -height), (0, -height)]]
+        box_rotate = [point.rotate(angle) for point in box]
+
+        min_x = min(point.x for point in box_rotate)
+        max_y = max(point.y for point in box_rotate)
+
+        pivot = Vector2(origin_position[0], -origin_position[1])
+        pivot_move = pivot.rotate(angle) - pivot
+
+        offset = Vector2(-origin_position[0] + min_x - pivot_move.x, -origin_position[1] - max_y + pivot_move.y)
+        image = pygame.transform.rotozoom(self._image, angle, 1)
+        mask = pygame.mask.from_surface(image)
+        bounds = mask.get_bounding_rects()
+        return RotatedFrame(image, mask, offset, bounds[0].unionall(bounds[1:]) if bounds else pygame.Rect(0, 0, 0, 0), mask.count() == image.get_width() * image.get_height())
+
+    def bake(self) -> None:
+        for angle in range(0, 360, self._step): self.get(angle)
+
+    def get(self, angle: int) -> RotatedFrame:
+        angle %= 360
+        frame = self._frames.get(angle)
+        if frame is None: frame = self._frames[angle] = self._bake(angle)
+        return frame
\ No newline at end of file
@@ -0,0 +1,235 @@
+import pygame
+
+from enum import Enum
+from typing import NamedTuple
+
+from src.camera import Camera
+from src.image_manager import ImageManager
+from src.level_grid import LevelGrid
+from src.level_stream import LevelStream
+from src.level_reader import build_level, resolve_level_path
+from src.spatial_index import SpatialIndex
+from src.obstacle_store import ObstacleStore
+from src.profiler import Profiler
+from src.entities import Player, Obstacle
+from src.entities.player import PlayerState
+from src.constants import PLAYER_IMAGE_PATH, SPRITE_SIZE
+
+SOLID_ONLY = (Obstacle.Behaviour.SOLID,)
+
+class SimulationSnapshot(NamedTuple):
+    player: PlayerState
+    camera: tuple[float, float]
+    status: "Simulation.Status"
+    points: int
+    tick: int
+    taken: int
+
+class Simulation:
+    class Status(Enum):
+        RUNNING = 0
+        DIED = 1
+        COMPLETED = 2
+
+    def __init__(self, level_path: str, image_manager: ImageManager, streaming: bool = False, profiler: Profiler | None = None, obstacle_store: bool = False) -> None:
+        self._level_path = level_path
+        self._profiler = profiler or Profiler(enabled=False)
+        self._obstacles_group = pygame.sprite.Group()
+        self._camera = Camera()
+        self._player = Player(image_manager.get_rotation_atlas(PLAYER_IMAGE_PATH, SPRITE_SIZE))
+
+        self._status = Simulation.Status.RUNNING
+        self._points = 0
+        self._tick = 0
+        self._collected: list[Obstacle] = []
+        self._taken: list[Obstacle] = []
+        self.contact_point: tuple[int, int] | None = None
+        self._query_rects: list[pygame.Rect] = []
+        self._candidates: list[Obstacle] = []
+        self._handlers = {
+            Obstacle.Behaviour.SOLID: self._hit_solid,
+            Obstacle.Behaviour.LETHAL: self._hit_lethal,
+            Obstacle.Behaviour.COLLECTIBLE: self._collect,
+            Obstacle.Behaviour.GOAL: self._reach_goal,
+        }
+
+        level = LevelGrid.from_file(resolve_level_path(level_path))
+        self._level = level
+        self._obstacle_store = obstacle_store
+        if obstacle_store:
+            self._level_stream = None
+            self._obstacles_index: SpatialIndex | ObstacleStore = ObstacleStore(level, image_manager)
+        elif streaming:
+            self._obstacles_index = SpatialIndex()
+            self._level_stream = LevelStream(level, image_manager, self._obstacles_group, self._obstacles_index)
+            self._level_stream.update(self._camera.viewport)
+        else:
+            self._level_stream = None
+            self._obstacles_index = SpatialIndex()
+            build_level(level, image_manager, self._obstacles_group, self._obstacles_index)
+
+        portal = level.find(4)
+        self._portal_x = portal[0] * SPRITE_SIZE[0] if portal else None
+        self._initial_portal_distance = self.portal_distance() if self._portal_x is not None else None
+
+    @property
+    def level_path(self) -> str:
+        return self._level_path
+
+    @property
+    def level(self) -> LevelGrid:
+        return self._level
+
+    @property
+    def obstacles(self) -> pygame.sprite.Group:
+        return self._obstacles_group
+
+    @property
+    def player(self) -> Player:
+        return self._player
+
+    @property
+    def camera(self) -> Camera:
+        return self._camera
+
+    @property
+    def status(self) -> Status:
+        return self._status
+
+    @property
+    def points(self) -> int:
+        return self._points
+
+    @property
+    def tick(self) -> int:
+        return self._tick
+
+    @property
+    def collected(self) -> list[Obstacle]:
+        return self._collected
+
+    @property
+    def query_rects(self) -> list[pygame.Rect]:
+        return self._query_rects
+
+    @property
+    def candidates(self) -> list[Obstacle]:
+        return self._candidates
+
+    @property
+    def has_portal(self) -> bool:
+        return self._portal_x is not None
+
+    @property
+    def initial_portal_distance(self) -> int | None:
+        return self._initial_portal_distance
+
+    def portal_distance(self) -> int:
+        return abs(self._portal_x - self._camera.x - self._player.rect.left)
+
+    def visible_obstacles(self, dynamic_only: bool = False) -> list[Obstacle]:
+        visible = self._obstacles_index.query(self._camera.viewport)
+        return [obstacle for obstacle in visible if not obstacle.is_static] if dynamic_only else visible
+
+    def finish(self, status: Status) -> None:
+        self._player.died()
+        self._status = status
+
+    def _hit_solid(self, obstacle: Obstacle) -> None:
+        if obstacle.rect.top <= self._player.rect.center[1] or self._player.rect.center[1] >= obstacle.rect.bottom: self.finish(Simulation.Status.DIED)
+        elif self._player.velocity > 0: self._player.land(obstacle.rect.top, self._tick)
+
+    def _hit_lethal(self, obstacle: Obstacle) -> None:
+        self.finish(Simulation.Status.DIED)
+
+    def _collect(self, obstacle: Obstacle) -> None:
+        self._obstacles_group.remove(obstacle)
+        self._obstacles_index.deactivate(obstacle)
+        self._collected.append(obstacle)
+        self._taken.append(obstacle)
+        self._points += 1
+
+    def _reach_goal(self, obstacle: Obstacle) -> None:
+        self.finish(Simulation.Status.COMPLETED)
+
+    def collision_checks(self, obstacle: Obstacle) -> None:
+        self._handlers[obstacle.behaviour](obstacle)
+
+    def snapshot(self) -> SimulationSnapshot:
+        return SimulationSnapshot(self._player.snapshot(), self._camera.snapshot(), self._status, self._points, self._tick, len(self._taken))
+
+    def restore(self, snapshot: SimulationSnapshot) -> None:
+        self._player.restore(snapshot.player)
+        self._camera.restore(snapshot.camera)
+        self._status = snapshot.status
+        self._points = snapshot.points
+        self._tick = snapshot.tick
+        self._collected = []
+        self._query_rects = []
+        self._candidates = []
+        self.contact_point = None
+
+        if self._level_stream:
+            self._level_stream.reset()
+            self._level_stream.update(self._camera.viewport)
+        else:
+            for coin in self._taken[snapshot.taken:]:
+                self._obstacles_group.add(coin)
+                self._obstacles_index.activate(coin)
+        del self._taken[snapshot.taken:]
+
+    def has_block_above(self) -> bool:
+        head_rect = self._player.rect.copy()
+        head_rect.height = 4
+        head_rect.top = self._player.rect.top - head_rect.height - 1
+        head_rect = self._camera.to_world(head_rect)
+        self._query_rects.append(head_rect)
+        return bool(self._obstacles_index.query(head_rect, SOLID_ONLY))
+
+    def has_block_below(self) -> bool:
+        head_rect = self._player.rect.copy()
+        head_rect.height = 4
+        head_rect.bottom = self._player.rect.bottom + head_rect.height + 1
+        head_rect = self._camera.to_world(head_rect)
+        self._query_rects.append(head_rect)
+        return bool(self._obstacles_index.query(head_rect, SOLID_ONLY))
+
+    def step(self, jump: bool) -> Status:
+        if self._status != Simulation.Status.RUNNING: return self._status
+        self._tick += 1
+        self._collected = []
+        self._query_rects = []
+
+        with self._profiler.section("update.player"):
+            if jump and not self.has_block_above(): self._player.jump(self._tick)
+
+            if not self._player.is_jumping and not self.has_block_below(): self._player.is_on_ground = False
+
+            self.contact_point = None
+            if not self._player.is_on_ground: self._player.rotate()
+
+            self._player.update()
+
+        with self._profiler.section("update.scroll"):
+            self._camera.advance()
+            if self._level_stream: self._level_stream.update(self._camera.viewport)
+            if self._obstacle_store: self._obstacles_index.release(self._camera.viewport.left)
+
+        with self._profiler.section("update.collision"):
+            player_rect = self._camera.to_world(self._player.rect)
+            hitbox = self._camera.to_world(self._player.hitbox)
+            self._query_rects.append(player_rect)
+            self._candidates = self._obstacles_index.query(player_rect)
+            for obstacle in self._candidates:
+                if not hitbox.colliderect(obstacle.hitbox): continue
+                if self._player.has_full_mask and obstacle.has_full_mask:
+                    clip = player_rect.clip(obstacle.rect)
+                    overlap = (clip.left - player_rect.left, clip.top - player_rect.top)
+                else:
+                    offset = (obstacle.rect.left - player_rect.left, obstacle.rect.top - player_rect.top)
+                    overlap = self._player.mask.overlap(obstacle.mask, offset)
+                    if not overlap: continue
+                self.contact_point = (overlap[0] + self._player.rect.left, overlap[1] + self._player.rect.top)
+                self.collision_checks(obstacle)
+
+        return self._status
\ No newline at end of file
@@ -0,0 +1,56 @@
+import pygame
+
+from bisect import insort
+from typing import Iterable
+
+from src.entities.obstacle import Obstacle
+from src.constants import SPRITE_SIZE
+
+ALL_BEHAVIOURS = tuple(Obstacle.Behaviour)
+
+class SpatialIndex:
+    def __init__(self, cell_width: int = SPRITE_SIZE[0]) -> None:
+        self._cell_width = cell_width
+        self._partitions: dict[Obstacle.Behaviour, dict[int, list[Obstacle]]] = {behaviour: {} for behaviour in ALL_BEHAVIOURS}
+        self._all_partitions = tuple(self._partitions.values())
+
+    def _column_range(self, left: int, right: int) -> range:
+        return range(left // self._cell_width, (right - 1) // self._cell_width + 1)
+
+    @staticmethod
+    def _order(obstacle: Obstacle) -> tuple[int, int]:
+        return obstacle.rect.left, obstacle.rect.top
+
+    def insert(self, obstacle: Obstacle) -> None:
+        columns = self._partitions[obstacle.behaviour]
+        for column in self._column_range(obstacle.rect.left, obstacle.rect.right):
+            insort(columns.setdefault(column, []), obstacle, key=self._order)
+
+    def remove(self, obstacle: Obstacle) -> None:
+        columns = self._partitions[obstacle.behaviour]
+        for column in self._column_range(obstacle.rect.left, obstacle.rect.right):
+            bucket = columns.get(column)
+            if bucket and obstacle in bucket: bucket.remove(obstacle)
+            if not bucket: columns.pop(column, None)
+
+    def activate(self, obstacle: Obstacle) -> None:
+        obstacle.is_active = True
+
+    def deactivate(self, obstacle: Obstacle) -> None:
+        obstacle.is_active = False
+
+    def clear(self) -> None:
+        for columns in self._partitions.values(): columns.clear()
+
+    def query(self, rect: pygame.Rect, behaviours: Iterable[Obstacle.Behaviour] = ALL_BEHAVIOURS) -> list[Obstacle]:
+        seen: set[int] = set()
+        found: list[Obstacle] = []
+        column_range = self._column_range(rect.left, rect.right)
+        for columns in self._all_partitions if behaviours is ALL_BEHAVIOURS else [self._partitions[behaviour] for behaviour in behaviours]:
+            if not columns: continue
+            for column in column_range:
+                for obstacle in columns.get(column, ()):
+                    if id(obstacle) in seen or not obstacle.is_active or not obstacle.rect.colliderect(rect): continue
+                    seen.add(id(obstacle))
+                    found.append(obstacle)
+        return found
\ No newline at end of file
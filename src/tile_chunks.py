@@ -0,0 +1,40 @@
+import pygame
+
+from src.level_grid import LevelGrid
+from src.image_manager import ImageManager
+from src.level_reader import tile_assets
+from src.constants import SCREEN_SIZE, SPRITE_SIZE
+
+TileChunk = tuple[pygame.Surface, pygame.Rect]
+
+class TileChunks:
+    def __init__(self, grid: LevelGrid, image_manager: ImageManager, chunk_columns: int = SCREEN_SIZE[0] // SPRITE_SIZE[0]) -> None:
+        self._grid = grid
+        self._image_manager = image_manager
+        self._chunk_columns = chunk_columns
+        self._chunk_width = chunk_columns * SPRITE_SIZE[0]
+        # Only chunks from the viewport onwards stay resident; they are baked as they scroll into view
+        self._chunks: dict[int, TileChunk | None] = {}
+
+    def _bake(self, chunk: int) -> TileChunk | None:
+        tiles = []
+        for col, row, value in self._grid.columns(chunk * self._chunk_columns, (chunk + 1) * self._chunk_columns):
+            assets = tile_assets(value, self._image_manager)
+            if assets and assets[0].is_static: tiles.append((assets[1], col, row))
+        if not tiles: return None
+
+        top = min(row for _, _, row in tiles) * SPRITE_SIZE[1]
+        bottom = max(row * SPRITE_SIZE[1] + image.get_height() for image, _, row in tiles)
+        surface = pygame.Surface((self._chunk_width, bottom - top), pygame.SRCALPHA)
+        surface.blits([(image, ((col % self._chunk_columns) * SPRITE_SIZE[0], row * SPRITE_SIZE[1] - top)) for image, col, row in tiles], doreturn=False)
+        return surface, pygame.Rect(chunk * self._chunk_width, top, self._chunk_width, bottom - top)
+
+    def visible(self, viewport: pygame.Rect) -> list[TileChunk]:
+        first, last = viewport.left // self._chunk_width, (viewport.right - 1) // self._chunk_width
+        for chunk in [chunk for chunk in self._chunks if not first <= chunk <= last]: del self._chunks[chunk]
+
+        visible = []
+        for chunk in range(first, last + 1):
+            if chunk not in self._chunks: self._chunks[chunk] = self._bake(chunk)
+            if self._chunks[chunk]: visible.append(self._chunks[chunk])
+        return visible
\ No newline at end of file
@@ -0,0 +1,64 @@
+import os
+import sys
+import json
+import argparse
+import multiprocessing
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from src.image_manager import ImageManager
+from src.level_catalogue import LevelCatalogue
+from src.level_verifier import verify_level, verify_task
+from src.constants import VERIFY_SEGMENT_COLUMNS, VERIFY_CHUNK_STATES
+
+def main():
+    parser = argparse.ArgumentParser(description="Prove levels can be finished by searching every jump/no-jump input sequence, headless")
+    parser.add_argument("levels", nargs="*", help="level files to verify (default: every level in levels/)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="worker processes: levels are verified in parallel, a single level splits each segment's frontier across them")
+    parser.add_argument("--segment-columns", type=int, default=VERIFY_SEGMENT_COLUMNS, help="level columns searched per pool round")
+    parser.add_argument("--chunk-states", type=int, default=VERIFY_CHUNK_STATES, help="minimum frontier states handed to one worker when splitting a single level")
+    parser.add_argument("--traces", default="", metavar="DIR", help="save each winning input trace to DIR as a replay (play with main.py --replay)")
+    parser.add_argument("-o", "--output", default="", metavar="PATH", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    if args.levels: paths = args.levels
+    else:
+        catalogue = LevelCatalogue()
+        catalogue.refresh()
+        paths = catalogue.paths
+
+    image_manager = ImageManager()
+    report = {"processes": args.processes, "segment_columns": args.segment_columns, "levels": []}
+    with multiprocessing.Pool(args.processes) as pool:
+        if len(paths) == 1: results = [verify_level(paths[0], pool, args.processes, args.segment_columns, args.chunk_states, image_manager)]
+        else: results = pool.imap(verify_task, [(path, args.segment_columns) for path in paths])
+
+        for path, result in zip(paths, results):
+            trace_path = ""
+            if result.trace is not None and args.traces:
+                os.makedirs(args.traces, exist_ok=True)
+                trace_path = os.path.join(args.traces, f"{os.path.splitext(os.path.basename(path))[0]}.pydr")
+                result.trace.save(trace_path)
+
+            report["levels"].append({
+                "path": path,
+                "completable": result.completable,
+                "verified": result.verified,
+                "ticks": result.ticks,
+                "seconds": round(result.seconds, 2),
+                "jumps": [tick for tick, jump in enumerate(result.trace or [], 1) if jump],
+                "mandatory_jumps": result.mandatory_jumps,
+                "trace": trace_path,
+                "segments": [{**segment._asdict(), "death_rate": round(segment.deaths / segment.explored, 4) if segment.explored else None} for segment in result.segments],
+            })
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file: file.write(output)
+    else: print(output)
+    sys.exit(0 if all(level["completable"] for level in report["levels"]) else 1)
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file